@@ -0,0 +1,171 @@
+import os
+import sys
+import math
+import json
+import time
+import runpy
+import argparse
+import platform
+import statistics
+import subprocess
+
+# BENCHMARK SETTINGS
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+METRICS = ["import", "construction", "show", "first_event_loop"]
+DEFAULT_THRESHOLD = 0.10
+# Regressions smaller than this are treated as noise
+MIN_REGRESSION_MS = 1.0
+
+def load_main_window():
+    """Run main.py as a module and return its MainWindow class and import time"""
+    start = time.perf_counter()
+    namespace = runpy.run_path(MAIN_SCRIPT, run_name="bench_main")
+    return namespace["MainWindow"], (time.perf_counter() - start) * 1000
+
+def measure_window(app, window_class, profiler):
+    """Construct one MainWindow and time construction, show and the first event loop turn"""
+    from PyQt5.QtCore import QEventLoop, QTimer
+
+    profiler.reset()
+    start = time.perf_counter()
+    window = window_class()
+    constructed = time.perf_counter()
+
+    # FIRST EVENT LOOP TURN: everything queued by the constructor, including the first paint
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+    first_turn = time.perf_counter()
+
+    sample = {
+        "construction": (constructed - start) * 1000,
+        "show": profiler.durations().get("show", 0.0),
+        "first_event_loop": (first_turn - constructed) * 1000,
+    }
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return sample
+
+def run_child():
+    """Cold run: one window in this (fresh) process, JSON sample on stdout"""
+    # Import first so the import metric includes PyQt5 itself
+    window_class, import_ms = load_main_window()
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    from modules.app_profiler import StartupProfiler
+
+    sample = measure_window(app, window_class, StartupProfiler)
+    sample["import"] = import_ms
+    print(json.dumps(sample))
+
+def run_cold(runs):
+    """Collect samples from fresh subprocesses"""
+    samples = []
+    env = dict(os.environ)
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                                env=env, capture_output=True, text=True, check=True)
+        # The app prints to stdout too, the sample is the last line
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return samples
+
+def run_warm(runs):
+    """Collect samples from repeated constructions in this process"""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window_class, _ = load_main_window()
+    from modules.app_profiler import StartupProfiler
+
+    # First construction warms caches and is not counted
+    measure_window(app, window_class, StartupProfiler)
+    return [measure_window(app, window_class, StartupProfiler) for _ in range(runs)]
+
+def percentile(values, fraction):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+def summarize(samples):
+    summary = {}
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples if metric in sample]
+        if values:
+            summary[metric] = {
+                "min": round(min(values), 3),
+                "median": round(statistics.median(values), 3),
+                "p95": round(percentile(values, 0.95), 3),
+                "runs": len(values),
+            }
+    return summary
+
+def compare(results, baseline, threshold):
+    """Return a list of (mode, metric, baseline, current) medians that regressed"""
+    regressions = []
+    for mode, summary in results["modes"].items():
+        for metric, stats in summary.items():
+            base = baseline.get("modes", {}).get(mode, {}).get(metric)
+            if not base:
+                continue
+            delta = stats["median"] - base["median"]
+            if delta > MIN_REGRESSION_MS and stats["median"] > base["median"] * (1 + threshold):
+                regressions.append((mode, metric, base["median"], stats["median"]))
+    return regressions
+
+def print_summary(results):
+    for mode, summary in results["modes"].items():
+        print(f"{mode}:")
+        for metric, stats in summary.items():
+            print(f"  {metric:<18} min {stats['min']:9.2f} ms  median {stats['median']:9.2f} ms  "
+                  f"p95 {stats['p95']:9.2f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless MainWindow startup benchmark")
+    parser.add_argument("--cold", type=int, default=5, metavar="N", help="fresh process runs")
+    parser.add_argument("--warm", type=int, default=10, metavar="N", help="in-process runs")
+    parser.add_argument("--output", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a saved result")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown as a fraction (default 0.10)")
+    parser.add_argument("--platform", default="offscreen", help="QT_QPA_PLATFORM plugin")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ["QT_QPA_PLATFORM"] = args.platform
+    sys.path.insert(0, os.path.dirname(MAIN_SCRIPT))
+    os.chdir(os.path.dirname(MAIN_SCRIPT))
+
+    if args.child:
+        run_child()
+        sys.exit(0)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa": args.platform,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "modes": {},
+    }
+    if args.cold:
+        results["modes"]["cold"] = summarize(run_cold(args.cold))
+    if args.warm:
+        results["modes"]["warm"] = summarize(run_warm(args.warm))
+
+    print_summary(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for mode, metric, base, current in regressions:
+            print(f"REGRESSION {mode}/{metric}: median {base:.2f} ms -> {current:.2f} ms")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
@@ -0,0 +1,133 @@
+import os
+import re
+import sys
+import ast
+import argparse
+import subprocess
+
+# PROJECT MODULES
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGES = ["modules", "widgets"]
+SCRIPTS = ["main"]
+# Generated resource module, importing it is measured but never parsed
+SKIPPED_FILES = ["modules/resources_rc.py"]
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def project_modules():
+    """Map dotted module names of the project to their files"""
+    found = {name: os.path.join(ROOT, name + ".py") for name in SCRIPTS}
+    for package in PACKAGES:
+        for root, _, names in os.walk(os.path.join(ROOT, package)):
+            for name in names:
+                path = os.path.join(root, name)
+                if not name.endswith(".py") or os.path.relpath(path, ROOT).replace(os.sep, "/") in SKIPPED_FILES:
+                    continue
+                dotted = os.path.relpath(path, ROOT)[:-3].replace(os.sep, ".")
+                found[dotted[:-len(".__init__")] if dotted.endswith(".__init__") else dotted] = path
+    return found
+
+def resolve_relative(module, is_package, level, name):
+    """Resolve "from . x import y" inside module to an absolute dotted name"""
+    parts = module.split(".")
+    base = parts if is_package else parts[:-1]
+    base = base[:len(base) - (level - 1)] if level > 1 else base
+    return ".".join(base + ([name] if name else []))
+
+def import_graph(modules):
+    """Edges between project modules, a submodule importing its own package is not an edge"""
+    graph = {name: set() for name in modules}
+    for name, path in modules.items():
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        is_package = path.endswith("__init__.py")
+        for node in ast.walk(tree):
+            targets = []
+            if isinstance(node, ast.Import):
+                targets = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    base = resolve_relative(name, is_package, node.level, node.module)
+                # "from package import submodule" imports the submodule
+                targets = [f"{base}.{alias.name}" if f"{base}.{alias.name}" in modules else base
+                           for alias in node.names]
+            for target in targets:
+                if target in modules and target != name and not name.startswith(target + "."):
+                    graph[name].add(target)
+    return graph
+
+def find_cycles(graph):
+    """Strongly connected components with more than one module (Tarjan)"""
+    index, low, stack, on_stack, cycles = {}, {}, [], set(), []
+
+    def visit(node):
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        for target in sorted(graph[node]):
+            if target not in index:
+                visit(target)
+                low[node] = min(low[node], low[target])
+            elif target in on_stack:
+                low[node] = min(low[node], index[target])
+        if low[node] == index[node]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+            if len(component) > 1:
+                cycles.append(sorted(component))
+
+    for node in sorted(graph):
+        if node not in index:
+            visit(node)
+    return cycles
+
+def import_times():
+    """Run "python -X importtime -c 'import main'" and return (self_us, cumulative_us, name) rows"""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            rows.append((int(match.group(1)), int(match.group(2)), match.group(4)))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the project import graph and import cost")
+    parser.add_argument("--no-timing", action="store_true", help="only check for import cycles")
+    args = parser.parse_args()
+
+    modules = project_modules()
+    cycles = find_cycles(import_graph(modules))
+    for cycle in cycles:
+        print(f"Import cycle: {' -> '.join(cycle + cycle[:1])}")
+    if not cycles:
+        print(f"No import cycles between {len(modules)} project modules.")
+
+    if not args.no_timing:
+        rows = import_times()
+        names = [name for _, _, name in rows]
+        project = [row for row in rows if row[2] in modules or row[2] == "modules.resources_rc"]
+
+        print(f"\n{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+        for self_us, cumulative_us, name in sorted(project, key=lambda row: -row[1]):
+            print(f"{self_us / 1000:10.2f} {cumulative_us / 1000:16.2f}  {name}")
+        pyqt = sum(self_us for self_us, _, name in rows if name.split(".")[0] in ("PyQt5", "sip"))
+        print(f"{pyqt / 1000:10.2f} {'':16}  PyQt5 (all modules, self time)")
+
+        # A module executed twice means a cycle re-entered a partially imported module
+        repeated = sorted({name for name in names if names.count(name) > 1 and name in modules})
+        for name in repeated:
+            print(f"Module imported more than once: {name}")
+        cycles += [[name] for name in repeated]
+
+    sys.exit(1 if cycles else 0)
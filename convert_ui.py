@@ -1,7 +1,35 @@
 import os
+import re
 import sys
+import ast
+import glob
+import json
+import struct
+import hashlib
+import fnmatch
+import argparse
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import xml.etree.ElementTree as ET
 from PyQt5 import uic
 
+# BINARY RESOURCE BUNDLE (same layout as "rcc -binary")
+RCC_MAGIC = b"qres"
+RCC_HEADER_SIZE = 20
+
+# RESOURCE PRUNING
+# Sources scanned for ":/prefix/path" URLs, "resources_rc.py" is a build output
+RESOURCE_SOURCES = ["main.ui", "main.py", "themes/*.qss", "modules/*.py", "widgets/**/*.py"]
+RESOURCE_SOURCES_IGNORED = ["modules/resources_rc.py"]
+# Patterns (one per line) for resources loaded with dynamically built URLs
+RESOURCE_ALLOWLIST_FILE = "resources_allowlist.txt"
+RESOURCE_URL_PATTERN = re.compile(r"(?<![\w/]):/[\w.-][\w./-]*")
+
+# BUILD CACHE
+# Content hashes of the inputs and outputs of the last successful build steps
+BUILD_CACHE_FILE = ".build_cache.json"
+
 def convert_ui_to_py(ui_file, output_file):
     """Convert .ui file to .py file"""
     try:
@@ -34,7 +62,12 @@ def compile_resources(qrc_file, output_file):
             return False
 
         # Use pyrcc5 to compile resource file
-        os.system(f'"{sys.executable}" -m PyQt5.pyrcc_main {qrc_file} -o {output_file}')
+        result = subprocess.run([sys.executable, "-m", "PyQt5.pyrcc_main", qrc_file, "-o", output_file],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"Error during resource file compilation: {result.stderr.strip()}")
+            return False
+
         print(f"Resource file compilation successful: {qrc_file} -> {output_file}")
         return True
 
@@ -42,49 +75,298 @@ def compile_resources(qrc_file, output_file):
         print(f"Error during resource file compilation: {str(e)}")
         return False
 
+def read_resource_module(rc_file):
+    """Read the rcc format version and raw tables from a pyrcc generated module"""
+    tables = {}
+    with open(rc_file, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), rc_file)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and isinstance(node.value.value, bytes):
+                tables[target.id] = node.value.value
+
+    # Modules generated for Qt >= 5.8 carry both tree formats, older ones only v1
+    if "qt_resource_struct_v2" in tables:
+        return 2, tables["qt_resource_struct_v2"], tables["qt_resource_name"], tables["qt_resource_data"]
+    return 1, tables["qt_resource_struct"], tables["qt_resource_name"], tables["qt_resource_data"]
+
+def write_binary_resources(rc_file, rcc_file):
+    """Write the tables of a pyrcc generated module as a binary .rcc bundle"""
+    version, tree, names, data = read_resource_module(rc_file)
+
+    # Header, then data, names and tree blocks in the order rcc writes them
+    data_offset = RCC_HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = RCC_MAGIC + struct.pack(">iiii", version, tree_offset, data_offset, names_offset)
+
+    with open(rcc_file, 'wb') as f:
+        f.write(header)
+        f.write(data)
+        f.write(names)
+        f.write(tree)
+
+def compile_binary_resources(qrc_file, rcc_file, rc_file=None):
+    """Compile resource file to a binary bundle that can be memory-mapped"""
+    try:
+        if not os.path.exists(qrc_file):
+            print(f"Error: Resource file {qrc_file} not found.")
+            return False
+
+        # pyrcc5 has no binary output, so repack the tables of its Python output
+        if rc_file and os.path.exists(rc_file):
+            write_binary_resources(rc_file, rcc_file)
+        else:
+            fd, tmp_file = tempfile.mkstemp(suffix=".py")
+            os.close(fd)
+            try:
+                subprocess.run([sys.executable, "-m", "PyQt5.pyrcc_main", qrc_file, "-o", tmp_file],
+                               check=True, capture_output=True, text=True)
+                write_binary_resources(tmp_file, rcc_file)
+            finally:
+                os.remove(tmp_file)
+
+        print(f"Binary resource compilation successful: {qrc_file} -> {rcc_file}")
+        return True
+
+    except Exception as e:
+        print(f"Error during binary resource compilation: {str(e)}")
+        return False
+
+def scan_resource_urls(source_patterns):
+    """Collect resource URLs referenced by the given source files"""
+    ignored = {os.path.normpath(path) for path in RESOURCE_SOURCES_IGNORED}
+    urls = set()
+    for pattern in source_patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if os.path.normpath(path) in ignored:
+                continue
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                urls.update(RESOURCE_URL_PATTERN.findall(f.read()))
+    return urls
+
+def read_allowlist(allowlist_file):
+    """Read resource URL patterns that must always be kept"""
+    if not os.path.exists(allowlist_file):
+        return []
+    with open(allowlist_file, 'r', encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+def resource_url(prefix, file_element):
+    """Return the ":/" URL of a <file> entry of a .qrc file"""
+    path = file_element.get("alias") or file_element.text.strip()
+    prefix = prefix.strip("/")
+    return f":/{prefix}/{path}" if prefix else f":/{path}"
+
+def prune_resources(qrc_file, pruned_qrc_file, report_file, source_patterns, allowlist):
+    """Write a .qrc file with only the referenced or allow-listed resources"""
+    try:
+        if not os.path.exists(qrc_file):
+            print(f"Error: Resource file {qrc_file} not found.")
+            return False
+
+        used_urls = scan_resource_urls(source_patterns)
+        tree = ET.parse(qrc_file)
+        kept, unused = [], []
+
+        for qresource in tree.getroot().iter("qresource"):
+            prefix = qresource.get("prefix", "/")
+            for file_element in list(qresource.findall("file")):
+                url = resource_url(prefix, file_element)
+                if url in used_urls or any(fnmatch.fnmatch(url, pattern) for pattern in allowlist):
+                    kept.append(url)
+                else:
+                    unused.append((url, file_element.text.strip()))
+                    qresource.remove(file_element)
+
+        # Pruned file lives next to the original so relative paths still resolve
+        tree.write(pruned_qrc_file, encoding="utf-8")
+
+        base_dir = os.path.dirname(os.path.abspath(qrc_file))
+        unused_bytes = sum(os.path.getsize(os.path.join(base_dir, path)) for _, path in unused
+                           if os.path.exists(os.path.join(base_dir, path)))
+        report = {
+            "qrc": qrc_file,
+            "kept": sorted(kept),
+            "unused": sorted(url for url, _ in unused),
+            "unused_bytes": unused_bytes,
+            "missing": sorted(used_urls - set(kept) - {url for url, _ in unused}),
+            "allowlist": allowlist,
+        }
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+        print(f"Resource pruning: kept {len(kept)}, removed {len(unused)} "
+              f"({unused_bytes / 1024:.1f} KiB) -> {pruned_qrc_file}")
+        for url in report["missing"]:
+            print(f"Warning: {url} is referenced but not in {qrc_file}.")
+        return True
+
+    except Exception as e:
+        print(f"Error during resource pruning: {str(e)}")
+        return False
+
+def patch_ui_module(py_file):
+    """Point the generated UI module to the app resources and custom widgets"""
+    with open(py_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Modify resource file import and ensure single path
+    # "app_resources" registers "resources.rcc" and falls back to "resources_rc"
+    if "from . import resources_rc" in content:
+        content = content.replace(
+            "from . import resources_rc",
+            "from modules import app_resources"
+        )
+    else:
+        content = content.replace(
+            "import resources_rc",
+            "from modules import app_resources"
+        )
+
+    # Add SlidingStackedWidget import and usage
+    content = content.replace(
+        "from PyQt5 import QtCore, QtGui, QtWidgets",
+        "from PyQt5 import QtCore, QtGui, QtWidgets\nfrom widgets.sliding_stacked_widgets import SlidingStackedWidget"
+    )
+    content = content.replace(
+        "self.stackedWidget = QtWidgets.QStackedWidget(self.pagesContainer)",
+        "self.stackedWidget = SlidingStackedWidget(self.pagesContainer)"
+    )
+
+    # Save modified file
+    with open(py_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def build_ui(ui_file, py_file):
+    """Build step: main.ui -> ui_main.py"""
+    if not convert_ui_to_py(ui_file, py_file):
+        return False
+    patch_ui_module(py_file)
+    print("UI file conversion completed.")
+    return True
+
+def build_resources(qrc_file, rc_file, rcc_file):
+    """Build step: resources.qrc -> resources_rc.py and resources.rcc"""
+    if not compile_resources(qrc_file, rc_file):
+        return False
+    # Binary bundle is repacked from "resources_rc.py", which stays as fallback
+    if not compile_binary_resources(qrc_file, rcc_file, rc_file):
+        return False
+    print("Resource file compilation completed.")
+    return True
+
+def qrc_inputs(qrc_file):
+    """Return the .qrc file and every file it lists"""
+    base_dir = os.path.dirname(qrc_file)
+    files = [qrc_file]
+    for file_element in ET.parse(qrc_file).getroot().iter("file"):
+        files.append(os.path.join(base_dir, file_element.text.strip()))
+    return files
+
+def file_hash(path):
+    """Return the sha256 of a file, None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_build_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_build_cache(cache_file, cache):
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+def step_hashes(inputs, outputs):
+    """Hashes recorded for a build step, the build script counts as an input"""
+    return {
+        "inputs": {path: file_hash(path) for path in inputs + [os.path.relpath(__file__)]},
+        "outputs": {path: file_hash(path) for path in outputs},
+    }
+
+def is_up_to_date(cache, step, inputs, outputs):
+    """A step is up to date if inputs are unchanged and outputs were not touched"""
+    entry = cache.get(step)
+    if not entry:
+        return False
+    current = step_hashes(inputs, outputs)
+    return entry == current and None not in current["outputs"].values()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert main.ui and compile resources.qrc")
+    parser.add_argument("--prune", action="store_true",
+                        help="compile only the resources referenced by the UI, themes and code")
+    parser.add_argument("--keep", action="append", default=[], metavar="PATTERN",
+                        help="resource URL pattern to keep when pruning (can be repeated)")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if the build cache says everything is up to date")
+    args = parser.parse_args()
+
     # Set file paths
     ui_file = "main.ui"
     py_file = "modules/ui_main.py"
     qrc_file = "resources.qrc"
     rc_file = "modules/resources_rc.py"
+    rcc_file = "modules/resources.rcc"
+    pruned_qrc_file = "resources.pruned.qrc"
+    report_file = "resources_report.json"
+
+    # Prune resource file
+    if args.prune:
+        allowlist = read_allowlist(RESOURCE_ALLOWLIST_FILE) + args.keep
+        if not prune_resources(qrc_file, pruned_qrc_file, report_file, RESOURCE_SOURCES, allowlist):
+            sys.exit(1)
+        qrc_file = pruned_qrc_file
+
+    for path in (ui_file, qrc_file):
+        if not os.path.exists(path):
+            print(f"Error: Input file {path} not found.")
+            sys.exit(1)
+
+    # Build steps: name -> (function, arguments, inputs, outputs)
+    steps = {
+        "uic": (build_ui, (ui_file, py_file), [ui_file], [py_file]),
+        "rcc": (build_resources, (qrc_file, rc_file, rcc_file), qrc_inputs(qrc_file), [rc_file, rcc_file]),
+    }
+
+    # Skip steps whose inputs and outputs match the build cache
+    cache = {} if args.force else load_build_cache(BUILD_CACHE_FILE)
+    stale = {}
+    for name, (function, step_args, inputs, outputs) in steps.items():
+        if is_up_to_date(cache, name, inputs, outputs):
+            print(f"{name}: up to date.")
+        else:
+            stale[name] = (function, step_args)
+
+    # uic and rcc are independent, run them in parallel worker processes
+    failed = []
+    if stale:
+        with ProcessPoolExecutor(max_workers=len(stale)) as executor:
+            futures = {name: executor.submit(function, *step_args) for name, (function, step_args) in stale.items()}
+            for name, future in futures.items():
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    print(f"Error during {name}: {str(e)}")
+                    ok = False
+                if ok:
+                    cache[name] = step_hashes(steps[name][2], steps[name][3])
+                else:
+                    cache.pop(name, None)
+                    failed.append(name)
+        save_build_cache(BUILD_CACHE_FILE, cache)
 
-    # Convert UI file
-    if convert_ui_to_py(ui_file, py_file):
-        print("UI file conversion completed.")
-
-        # Compile resource file
-        if compile_resources(qrc_file, rc_file):
-            print("Resource file compilation completed.")
-
-            # Modify import statements
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Modify resource file import and ensure single path
-            if "from . import resources_rc" in content:
-                content = content.replace(
-                    "from . import resources_rc",
-                    "from modules import resources_rc"
-                )
-            else:
-                content = content.replace(
-                    "import resources_rc",
-                    "from modules import resources_rc"
-                )
-
-            # Add SlidingStackedWidget import and usage
-            content = content.replace(
-                "from PyQt5 import QtCore, QtGui, QtWidgets",
-                "from PyQt5 import QtCore, QtGui, QtWidgets\nfrom widgets.sliding_stacked_widgets import SlidingStackedWidget"
-            )
-            content = content.replace(
-                "self.stackedWidget = QtWidgets.QStackedWidget(self.pagesContainer)",
-                "self.stackedWidget = SlidingStackedWidget(self.pagesContainer)"
-            )
-
-            # Save modified file
-            with open(py_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print("File modification completed.")
+    if failed:
+        print(f"Build failed: {', '.join(failed)}.")
+        sys.exit(1)
+    print("Build completed.")
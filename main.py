@@ -16,16 +16,19 @@
 
 import sys
 import os
-import platform
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
+import json
+import time
+import argparse
+STARTUP_TIME = time.perf_counter()
+from PyQt5.QtWidgets import QApplication, QMainWindow
+from PyQt5.QtCore import Qt, QEasingCurve
+from PyQt5.QtGui import QIcon
+QT_IMPORT_TIME = time.perf_counter()
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from modules import *
-from widgets import *
-from widgets.sliding_stacked_widgets import SlidingStackedWidget
+from modules import Ui_MainWindow, Settings, UIFunctions, AppFunctions, StartupProfiler, InitScheduler
+from widgets import PageLifecycleManager, HiddenPageSuspender
 os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
 
 # SET AS GLOBAL WIDGETS
@@ -39,7 +42,8 @@ class MainWindow(QMainWindow):
         # SET AS GLOBAL WIDGETS
         # ///////////////////////////////////////////////////////////////
         self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with StartupProfiler.phase("setup_ui"):
+            self.ui.setupUi(self)
         global widgets
         widgets = self.ui
 
@@ -59,13 +63,39 @@ class MainWindow(QMainWindow):
         # ///////////////////////////////////////////////////////////////
         widgets.toggleButton.clicked.connect(lambda: UIFunctions.toggleMenu(self, True))
 
+        # STAGED INIT
+        # Only the frame and title bar are set up before "show()", the stages
+        # below run from the event loop after the first paint (lower priority first)
+        # ///////////////////////////////////////////////////////////////
+        self.initScheduler = InitScheduler(self, Settings.INIT_SLICE_MS)
+        self.initScheduler.stageFinished.connect(
+            lambda name, start, end: StartupProfiler.record("stage_" + name, start, end))
+
         # SET UI DEFINITIONS
         # ///////////////////////////////////////////////////////////////
-        UIFunctions.uiDefinitions(self)
+        with StartupProfiler.phase("ui_definitions"):
+            UIFunctions.uiDefinitions(self, Settings.DEFERRED_INIT)
+        if Settings.DEFERRED_INIT:
+            self.initScheduler.addStage("grips", lambda: UIFunctions.setupGrips(self), 0)
+            self.initScheduler.addStage("shadow", lambda: UIFunctions.setupShadow(self), 3)
 
-        # QTableWidget PARAMETERS
+        # DATA TABLE PARAMETERS
+        # ///////////////////////////////////////////////////////////////
+        def setupTable():
+            AppFunctions.setupDataTable(self)
+            widgets.tableWidget.setColumnSizing(Settings.TABLE_COLUMN_SIZING)
+            if Settings.SUSPEND_HIDDEN_PAGES:
+                self.pageSuspender.register(widgets.widgets, self.tableStream)
+            widgets.btn_save.setEnabled(True)
+        self.initScheduler.addStage("table", setupTable, 2)
+
+        # LOG CONSOLE
         # ///////////////////////////////////////////////////////////////
-        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        def setupLogConsole():
+            AppFunctions.setupLogConsole(self)
+            if Settings.SUSPEND_HIDDEN_PAGES:
+                self.pageSuspender.register(widgets.widgets, self.logConsole.timer)
+        self.initScheduler.addStage("log_console", setupLogConsole, 2)
 
         # BUTTONS CLICK
         # ///////////////////////////////////////////////////////////////
@@ -75,6 +105,8 @@ class MainWindow(QMainWindow):
         widgets.btn_widgets.clicked.connect(self.buttonClick)
         widgets.btn_new.clicked.connect(self.buttonClick)
         widgets.btn_save.clicked.connect(self.buttonClick)
+        # Saving exports the table, enabled once the "table" stage has run
+        widgets.btn_save.setEnabled(False)
 
         # EXTRA LEFT BOX
         def openCloseLeftBox():
@@ -89,7 +121,9 @@ class MainWindow(QMainWindow):
 
         # SHOW APP
         # ///////////////////////////////////////////////////////////////
-        self.show()
+        StartupProfiler.watchFirstPaint(widgets.bgApp, self.firstPaint, finish=not Settings.DEFERRED_INIT)
+        with StartupProfiler.phase("show"):
+            self.show()
 
         # SET CUSTOM THEME
         # ///////////////////////////////////////////////////////////////
@@ -97,12 +131,14 @@ class MainWindow(QMainWindow):
         themeFile = "themes\py_dracula_light.qss"
 
         # SET THEME AND HACKS
-        if useCustomTheme:
-            # LOAD AND APPLY STYLE
-            UIFunctions.theme(self, themeFile, True)
+        # Kept before the first paint, the selected menu style depends on the hacks
+        with StartupProfiler.phase("theme"):
+            if useCustomTheme:
+                # LOAD AND APPLY STYLE
+                UIFunctions.theme(self, themeFile, True)
 
-            # SET HACKS
-            AppFunctions.setThemeHack(self)
+                # SET HACKS
+                AppFunctions.setThemeHack(self)
 
         # SET HOME PAGE AND SELECT MENU
         # ///////////////////////////////////////////////////////////////
@@ -111,11 +147,49 @@ class MainWindow(QMainWindow):
 
         # CONFIGURE SLIDING STACKED WIDGET
         # ///////////////////////////////////////////////////////////////
-        # Configure sliding transitions
-        widgets.stackedWidget.setSpeed(300)  # Set animation duration to 300ms
-        widgets.stackedWidget.setAnimation(QEasingCurve.InOutQuart)  # Set animation curve
-        widgets.stackedWidget.setDirection(Qt.Horizontal)  # Set horizontal slide direction
+        def setupStackedWidget():
+            # Configure sliding transitions
+            widgets.stackedWidget.setSpeed(300)  # Set animation duration to 300ms
+            widgets.stackedWidget.setAnimation(QEasingCurve.InOutQuart)  # Set animation curve
+            widgets.stackedWidget.setDirection(Qt.Horizontal)  # Set horizontal slide direction
+            widgets.stackedWidget.setTransitionMode(Settings.PAGE_TRANSITION_MODE)  # Slide live pages or snapshots
+            widgets.stackedWidget.setRetargetMode(Settings.PAGE_RETARGET_MODE)  # Clicks during a slide go straight to the new page
+        self.initScheduler.addStage("stacked_widget", setupStackedWidget, 1)
+
+        # LAZY PAGES
+        # Add pages with "widgets.stackedWidget.addLazyWidget(builder)", "builder(page)"
+        # fills the empty page the first time it is shown
+        # ///////////////////////////////////////////////////////////////
+        widgets.new_page = widgets.stackedWidget.addLazyWidget(
+            lambda page: AppFunctions.buildNewPage(self, page), "new_page")
+        if Settings.PREBUILD_PAGES:
+            self.initScheduler.addStage(
+                "prebuild_pages", lambda: widgets.stackedWidget.prebuildPages(Settings.PREBUILD_INTERVAL), 10)
+        # Built lazy pages over the budget are unloaded, least recently visited first
+        # Pages keep state across an unload with "save_state()" / "restore_state(state)"
+        self.pageLifecycle = PageLifecycleManager(
+            widgets.stackedWidget, Settings.PAGE_BUDGET, Settings.PAGE_MEMORY_BUDGET_MB, Settings.PAGE_IDLE_UNLOAD_S, self)
+
+        # PAGE VISIBILITY
+        # "stackedWidget" emits pageEntered / pageLeft / pageIdle and calls the page's
+        # "on_enter()" / "on_leave()" / "on_idle()", "pageSuspender.register(page, timer)"
+        # stops a timer (or slows down a row stream) while its page is hidden
+        # ///////////////////////////////////////////////////////////////
+        self.pageSuspender = HiddenPageSuspender(widgets.stackedWidget, self)
 
+        # RUN NOW WHEN STAGED INIT IS DISABLED
+        if not Settings.DEFERRED_INIT:
+            self.initScheduler.runAll()
+
+
+    # FIRST PAINT
+    # Post here work that can wait until the window is on screen
+    # ///////////////////////////////////////////////////////////////
+    def firstPaint(self):
+        # DEFERRED INIT STAGES
+        if Settings.DEFERRED_INIT:
+            self.initScheduler.finished.connect(StartupProfiler.finish)
+            self.initScheduler.start()
 
     # BUTTONS CLICK
     # Post here your functions for clicked buttons
@@ -144,7 +218,7 @@ class MainWindow(QMainWindow):
             btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
 
         if btnName == "btn_save":
-            print("Save BTN clicked!")
+            AppFunctions.saveTable(self)
 
         # PRINT BTN NAME
         print(f'Button "{btnName}" pressed!')
@@ -169,7 +243,27 @@ class MainWindow(QMainWindow):
             print('Mouse click: RIGHT CLICK')
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    # STARTUP PROFILER
+    # ///////////////////////////////////////////////////////////////
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile-startup", nargs="?", const=StartupProfiler.OUTPUT_FILE, metavar="FILE")
+    parser.add_argument("--profile-runs", type=int, default=1, metavar="N")
+    parser.add_argument("--profile-quit", action="store_true")
+    args, qt_args = parser.parse_known_args()
+
+    if args.profile_startup and args.profile_runs > 1:
+        # MEDIAN OVER FRESH PROCESSES
+        report = StartupProfiler.runRepeated(__file__, args.profile_runs, args.profile_startup, qt_args)
+        print(json.dumps(report["median_ms"], indent=2))
+        sys.exit(0)
+
+    StartupProfiler.START = STARTUP_TIME
+    StartupProfiler.record("pyqt_imports", STARTUP_TIME, QT_IMPORT_TIME)
+    StartupProfiler.ENABLED = bool(args.profile_startup)
+    StartupProfiler.OUTPUT_FILE = args.profile_startup or StartupProfiler.OUTPUT_FILE
+    StartupProfiler.QUIT_AFTER_PAINT = args.profile_quit
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setWindowIcon(QIcon("icon.ico"))
     window = MainWindow()
     sys.exit(app.exec())
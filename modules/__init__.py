@@ -13,9 +13,11 @@
 # https://doc.qt.io/qtforpython/licenses.html
 #
 # ///////////////////////////////////////////////////////////////
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+# STARTUP PROFILER
+from . app_profiler import StartupProfiler
+
+# STAGED INIT
+from . app_scheduler import InitScheduler
 
 # GUI FILE
 from . ui_main import Ui_MainWindow
@@ -24,7 +26,7 @@ from . ui_main import Ui_MainWindow
 from . app_settings import Settings
 
 # IMPORT FUNCTIONS
-from . ui_functions import *
+from . ui_functions import UIFunctions
 
 # APP FUNCTIONS
-from . app_functions import *
+from . app_functions import AppFunctions
@@ -14,13 +14,138 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+# APP SETTINGS
 # ///////////////////////////////////////////////////////////////
-from main import *
+import os
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QFileDialog, QLabel, QProgressDialog, QVBoxLayout
+from . app_settings import Settings
+from widgets import LogConsole
+from widgets.data_table import ColumnStore, DataTableModel, RowStream, TableExport, openFileSource
 
 # WITH ACCESS TO MAIN WINDOW WIDGETS
 # ///////////////////////////////////////////////////////////////
-class AppFunctions(MainWindow):
+class AppFunctions():
+    # DATA TABLE
+    # Model of the "tableWidget" DataTable (promoted in main.ui)
+    # ///////////////////////////////////////////////////////////////
+    def setupDataTable(self):
+        store = ColumnStore.fromSchema([("0", "s"), ("1", "s"), ("2", "s"), ("3", "s")])
+        store.appendRow(["Test", "Text", "Cell", "Line"])
+        store.appendRows([["", "", "", ""]] * 15)
+        self.tableModel = DataTableModel(store, self, Settings.TABLE_DISPLAY_CACHE)
+        self.ui.tableWidget.setModel(self.tableModel)
+
+        # STREAMING ROWS
+        # Call "self.tableStream.push(row)" / "pushMany(rows)" from any thread
+        self.tableStream = RowStream(self.tableModel, Settings.TABLE_MAX_ROWS, Settings.TABLE_FRAME_MS, self)
+        self.tableStream.start()
+
+        # FILE BOX "Open" loads a CSV or binary record file into the table
+        self.ui.pushButton.clicked.connect(lambda: AppFunctions.openTableFile(self))
+
+        # SEARCH
+        # "lineEdit" filters the table, once typing pauses for TABLE_SEARCH_DEBOUNCE_MS
+        self.ui.lineEdit.setPlaceholderText("Search table")
+        self.tableSearchTimer = QTimer(self)
+        self.tableSearchTimer.setSingleShot(True)
+        self.tableSearchTimer.setInterval(Settings.TABLE_SEARCH_DEBOUNCE_MS)
+        self.tableSearchTimer.timeout.connect(lambda: self.tableModel.search(self.ui.lineEdit.text()))
+        self.ui.lineEdit.textChanged.connect(lambda text: self.tableSearchTimer.start())
+
+    def openTableFile(self, path=None):
+        # The export worker reads the current source, it must not be closed under it
+        if AppFunctions.isExporting(self):
+            self.ui.labelVersion_3.setText("Wait for the export to finish before opening a file")
+            return
+        if not path:
+            path, _ = QFileDialog.getOpenFileName(self, "Open Table File", "",
+                "Table Files (*.csv *.tsv *.txt *.bin *.dat);;All Files (*)")
+        if not path:
+            return
+
+        # Streamed rows cannot be appended to a read-only file
+        self.tableStream.stop()
+        old_source = self.tableModel.source
+        source = openFileSource(path, self)
+        name = os.path.basename(path)
+        source.indexProgress.connect(lambda done, total: self.ui.labelVersion_3.setText(
+            f"Indexing {name}: {done * 100 // max(total, 1)}%"))
+        source.indexFinished.connect(lambda rows: self.ui.labelVersion_3.setText(f"{name}: {rows:,} rows"))
+        self.tableModel.setSource(source)
+        source.startIndex()
+        if hasattr(old_source, "close"):
+            old_source.close()
+            old_source.deleteLater()
+
+    # LOG CONSOLE
+    # Call "self.logConsole.log(line)" / "logLines(lines)" from any thread
+    # ///////////////////////////////////////////////////////////////
+    def setupLogConsole(self):
+        self.logConsole = LogConsole(self.ui.plainTextEdit, Settings.LOG_MAX_LINES, Settings.LOG_FRAME_MS, self)
+
+    # NEW PAGE
+    # Builder of the lazy "new_page", run the first time the page is shown or prebuilt
+    # ///////////////////////////////////////////////////////////////
+    def buildNewPage(self, page):
+        self.ui.verticalLayout_20 = QVBoxLayout(page)
+        self.ui.verticalLayout_20.setObjectName("verticalLayout_20")
+        self.ui.label = QLabel("NEW PAGE TEST", page)
+        self.ui.label.setAlignment(Qt.AlignCenter)
+        self.ui.label.setObjectName("label")
+        self.ui.verticalLayout_20.addWidget(self.ui.label)
+
+    # SAVE / EXPORT
+    # Table rows and the widgets page form, written by a worker thread
+    # ///////////////////////////////////////////////////////////////
+    def formState(self):
+        return {
+            "lineEdit": self.ui.lineEdit.text(),
+            "checkBox": self.ui.checkBox.isChecked(),
+            "radioButton": self.ui.radioButton.isChecked(),
+            "comboBox": self.ui.comboBox.currentIndex(),
+            "horizontalSlider": self.ui.horizontalSlider.value(),
+            "verticalSlider": self.ui.verticalSlider.value(),
+            "horizontalScrollBar": self.ui.horizontalScrollBar.value(),
+            "verticalScrollBar": self.ui.verticalScrollBar.value(),
+        }
+
+    def isExporting(self):
+        return getattr(self, "tableExport", None) is not None and self.tableExport.isRunning()
+
+    def saveTable(self):
+        if AppFunctions.isExporting(self):
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Table", "",
+            "Binary Columnar (*.pdtc);;CSV Files (*.csv)")
+        if not path:
+            return
+
+        # The store must not change under the worker, queued rows wait in the stream
+        streaming = self.tableStream.isRunning()
+        self.tableStream.stop()
+        source = self.tableModel.source
+        self.tableExport = TableExport(self.tableModel, path, AppFunctions.formState(self), self)
+
+        progress = QProgressDialog("Exporting table...", "Cancel", 0, 1000, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.canceled.connect(self.tableExport.cancel)
+        self.tableExport.progress.connect(lambda done, total: progress.setValue(done * 1000 // max(total, 1)))
+
+        def finished(ok, message):
+            progress.reset()
+            progress.deleteLater()
+            # Only the store rows were streamed into, a file opened since is read-only
+            if streaming and self.tableModel.source is source:
+                self.tableStream.start()
+            self.ui.labelVersion_3.setText(message)
+            print(message)
+        self.tableExport.finished.connect(finished)
+        self.tableExport.start()
+
+    # THEME HACKS
+    # ///////////////////////////////////////////////////////////////
     def setThemeHack(self):
         Settings.BTN_LEFT_BOX_COLOR = "background-color: #495474;"
         Settings.BTN_RIGHT_BOX_COLOR = "background-color: #495474;"
@@ -0,0 +1,151 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from PyQt5.QtCore import QObject, QEvent, QTimer, QCoreApplication
+
+# STARTUP PROFILER
+# Phases are always recorded (two perf_counter calls each), the report is
+# only written when "main.py --profile-startup" enables it.
+# ///////////////////////////////////////////////////////////////
+class StartupProfiler():
+    ENABLED = False
+    OUTPUT_FILE = "startup_profile.json"
+    QUIT_AFTER_PAINT = False
+    START = time.perf_counter()
+    PHASES = {}
+
+    @classmethod
+    def reset(cls, start=None):
+        cls.START = time.perf_counter() if start is None else start
+        cls.PHASES = {}
+
+    @classmethod
+    def record(cls, name, start, end):
+        cls.PHASES[name] = (start, end)
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(name, start, time.perf_counter())
+
+    @classmethod
+    def durations(cls):
+        return {name: (end - start) * 1000 for name, (start, end) in cls.PHASES.items()}
+
+    @classmethod
+    def report(cls):
+        phases = {}
+        for name, (start, end) in sorted(cls.PHASES.items(), key=lambda item: item[1][0]):
+            phases[name] = {
+                "start_ms": round((start - cls.START) * 1000, 3),
+                "end_ms": round((end - cls.START) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+            }
+        total = max((end for _, end in cls.PHASES.values()), default=cls.START) - cls.START
+        return {"phases": phases, "total_ms": round(total * 1000, 3)}
+
+    @classmethod
+    def write(cls, path=None):
+        with open(path or cls.OUTPUT_FILE, "w", encoding="utf-8") as f:
+            json.dump(cls.report(), f, indent=2)
+
+    # FIRST PAINT
+    # ///////////////////////////////////////////////////////////////
+    @classmethod
+    def watchFirstPaint(cls, widget, callback=None, finish=True, phase="first_paint"):
+        # WITH "finish=False" THE CALLER ENDS THE PROFILE WITH "finish()"
+        cls._paintWatcher = FirstPaintWatcher(widget, phase, lambda: cls.firstPaintDone(callback, finish))
+
+    @classmethod
+    def firstPaintDone(cls, callback=None, finish=True):
+        if callback is not None:
+            callback()
+        if finish:
+            cls.finish()
+
+    @classmethod
+    def finish(cls):
+        if cls.ENABLED:
+            cls.write()
+            if cls.QUIT_AFTER_PAINT:
+                QCoreApplication.quit()
+
+    # REPEATED RUNS
+    # ///////////////////////////////////////////////////////////////
+    @classmethod
+    def runRepeated(cls, script, runs, output=None, extra_args=()):
+        # Only needed by "--profile-runs", kept out of every normal startup
+        import tempfile
+        import statistics
+        import subprocess
+        samples = []
+        for _ in range(runs):
+            fd, sample_file = tempfile.mkstemp(suffix=".json")
+            os.close(fd)
+            try:
+                # FROZEN BUILDS ARE THEIR OWN INTERPRETER
+                command = [sys.executable] if getattr(sys, "frozen", False) else [sys.executable, script]
+                args = command + ["--profile-startup", sample_file, "--profile-quit"]
+                subprocess.run(args + list(extra_args), check=True)
+                with open(sample_file, "r", encoding="utf-8") as f:
+                    samples.append(json.load(f))
+            finally:
+                os.remove(sample_file)
+
+        names = []
+        for sample in samples:
+            names += [name for name in sample["phases"] if name not in names]
+        median = {name: round(statistics.median(s["phases"][name]["duration_ms"] for s in samples
+                                                 if name in s["phases"]), 3) for name in names}
+        report = {
+            "runs": runs,
+            "median_ms": median,
+            "median_total_ms": round(statistics.median(s["total_ms"] for s in samples), 3),
+            "samples": samples,
+        }
+        with open(output or cls.OUTPUT_FILE, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+class FirstPaintWatcher(QObject):
+    def __init__(self, widget, phase, callback):
+        super(FirstPaintWatcher, self).__init__(widget)
+        self.widget = widget
+        self.phase = phase
+        self.callback = callback
+        self.start = time.perf_counter()
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            # RECORD ONCE THE PAINT EVENT HAS BEEN DELIVERED
+            QTimer.singleShot(0, self._painted)
+        return False
+
+    def _painted(self):
+        StartupProfiler.record(self.phase, self.start, time.perf_counter())
+        self.callback()
@@ -0,0 +1,46 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+
+import os
+import sys
+from PyQt5.QtCore import QResource
+from . app_profiler import StartupProfiler
+
+# RESOURCE BUNDLE
+# "resources.rcc" is registered by path so Qt maps the file instead of
+# Python parsing and keeping the "resources_rc.py" byte literals alive.
+# ///////////////////////////////////////////////////////////////
+RCC_FILE = "resources.rcc"
+
+def resourceBundlePaths():
+    paths = [os.path.join(os.path.dirname(os.path.abspath(__file__)), RCC_FILE)]
+    # FROZEN BUILDS KEEP THE BUNDLE NEXT TO THE EXECUTABLE
+    if getattr(sys, "frozen", False):
+        paths.insert(0, os.path.join(os.path.dirname(sys.executable), RCC_FILE))
+    return paths
+
+def loadResources():
+    for path in resourceBundlePaths():
+        if os.path.exists(path) and QResource.registerResource(path):
+            return path
+
+    # FALLBACK TO THE COMPILED PYTHON MODULE
+    from . import resources_rc
+    return resources_rc.__file__
+
+with StartupProfiler.phase("resources"):
+    RESOURCES_SOURCE = loadResources()
@@ -0,0 +1,81 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+
+import time
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# STAGED INIT SCHEDULER
+# Runs deferred init stages from the event loop in short idle slices.
+# Lower priority values run first, equal priorities keep insertion order.
+# ///////////////////////////////////////////////////////////////
+class InitScheduler(QObject):
+    stageFinished = pyqtSignal(str, float, float)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, slice_ms=8):
+        super(InitScheduler, self).__init__(parent)
+        self.slice_ms = slice_ms
+        self.stages = []
+        self.timings = {}
+        self.running = False
+        self.done = False
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._runSlice)
+
+    def addStage(self, name, function, priority=0):
+        self.stages.append((priority, len(self.stages), name, function))
+        self.stages.sort(key=lambda stage: stage[:2])
+
+    def pendingStages(self):
+        return [name for _, _, name, _ in self.stages]
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.timer.start()
+
+    def runAll(self):
+        """Run every pending stage now, e.g. before closing the window"""
+        while self.stages:
+            self._runStage()
+        self._finish()
+
+    def _runStage(self):
+        _, _, name, function = self.stages.pop(0)
+        start = time.perf_counter()
+        function()
+        end = time.perf_counter()
+        self.timings[name] = (end - start) * 1000
+        self.stageFinished.emit(name, start, end)
+
+    def _runSlice(self):
+        # RUN STAGES UNTIL THE SLICE BUDGET IS USED, ALWAYS AT LEAST ONE
+        deadline = time.perf_counter() + self.slice_ms / 1000
+        while self.stages:
+            self._runStage()
+            if time.perf_counter() >= deadline:
+                return
+        self._finish()
+
+    def _finish(self):
+        self.timer.stop()
+        self.running = False
+        if not self.done:
+            self.done = True
+            self.finished.emit()
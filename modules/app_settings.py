@@ -7,6 +7,52 @@ class Settings():
     RIGHT_BOX_WIDTH = 240
     TIME_ANIMATION = 500
 
+    # MENU / EXTRA BOXES ANIMATION
+    # "layout" animates the widths, "snapshot" slides cached pixmaps and lays out once
+    # Over ANIMATION_FRAME_BUDGET_MS per frame (0 = off) an animation jumps to its end
+    MENU_ANIMATION_MODE = "layout"
+    BOX_ANIMATION_MODE = "layout"
+    ANIMATION_FRAME_BUDGET_MS = 0
+
+    # PAGE TRANSITIONS
+    # "live" slides the page widgets, "snapshot" slides pixmaps rendered once per transition
+    PAGE_TRANSITION_MODE = "live"
+    # A page requested during a slide: "slide" there from the page mostly shown, "jump" cuts to it
+    PAGE_RETARGET_MODE = "slide"
+
+    # STAGED INIT
+    # Show the frame and title bar first, decorate it from the event loop after the first paint
+    DEFERRED_INIT = True
+    INIT_SLICE_MS = 8
+
+    # DATA TABLE
+    # Rows pushed to "tableStream" are inserted once per frame, the oldest are evicted over the cap
+    # Formatted text of the last TABLE_DISPLAY_CACHE cells shown is kept ("tableModel.displayCache.stats()")
+    TABLE_MAX_ROWS = 1000000
+    TABLE_FRAME_MS = 16
+    TABLE_DISPLAY_CACHE = 20000
+    # "stretch" or "sampled" (visible rows plus a random sample, "tableWidget.remeasureColumns()" to refresh)
+    TABLE_COLUMN_SIZING = "stretch"
+    TABLE_SEARCH_DEBOUNCE_MS = 150
+
+    # LOG CONSOLE
+    # "plainTextEdit" keeps the last LOG_MAX_LINES lines, new lines are rendered once per frame
+    LOG_MAX_LINES = 10000
+    LOG_FRAME_MS = 16
+
+    # LAZY PAGES
+    # Build pages added with "stackedWidget.addLazyWidget" while idle after the first paint
+    PREBUILD_PAGES = True
+    PREBUILD_INTERVAL = 0
+    # Unload the least recently visited lazy pages over PAGE_BUDGET built pages, over
+    # PAGE_MEMORY_BUDGET_MB of resident memory or PAGE_IDLE_UNLOAD_S hidden (0 = off)
+    PAGE_BUDGET = 0
+    PAGE_MEMORY_BUDGET_MB = 0
+    PAGE_IDLE_UNLOAD_S = 0
+    # While their page is hidden the log console stops rendering (new lines wait in its ring
+    # buffer) and the table stream inserts rows once a second instead of every frame
+    SUSPEND_HIDDEN_PAGES = True
+
     # BTNS LEFT AND RIGHT BOX COLORS
     BTN_LEFT_BOX_COLOR = "background-color: rgb(44, 49, 58);"
     BTN_RIGHT_BOX_COLOR = "background-color: #ff79c6;"
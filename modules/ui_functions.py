@@ -14,16 +14,21 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+from PyQt5.QtCore import Qt, QEvent, QEasingCurve, QPropertyAnimation, QParallelAnimationGroup
+from PyQt5.QtGui import QColor, QIcon
+from PyQt5.QtWidgets import QGraphicsDropShadowEffect, QPushButton, QSizeGrip
+
+# APP SETTINGS AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from main import *
+from . app_settings import Settings
+from widgets import CustomGrip, FrameBudget, LayoutMorph
 
 # GLOBALS
 # ///////////////////////////////////////////////////////////////
 GLOBAL_STATE = False
 GLOBAL_TITLE_BAR = True
 
-class UIFunctions(MainWindow):
+class UIFunctions():
     # MAXIMIZE/RESTORE
     # ///////////////////////////////////////////////////////////////
     def maximize_restore(self):
@@ -36,10 +41,8 @@ class UIFunctions(MainWindow):
             self.ui.maximizeRestoreAppBtn.setToolTip("Restore")
             self.ui.maximizeRestoreAppBtn.setIcon(QIcon(u":/icons/images/icons/icon_restore.png"))
             self.ui.frame_size_grip.hide()
-            self.left_grip.hide()
-            self.right_grip.hide()
-            self.top_grip.hide()
-            self.bottom_grip.hide()
+            for grip in UIFunctions.grips(self):
+                grip.hide()
         else:
             GLOBAL_STATE = False
             self.showNormal()
@@ -48,10 +51,8 @@ class UIFunctions(MainWindow):
             self.ui.maximizeRestoreAppBtn.setToolTip("Maximize")
             self.ui.maximizeRestoreAppBtn.setIcon(QIcon(u":/icons/images/icons/icon_maximize.png"))
             self.ui.frame_size_grip.show()
-            self.left_grip.show()
-            self.right_grip.show()
-            self.top_grip.show()
-            self.bottom_grip.show()
+            for grip in UIFunctions.grips(self):
+                grip.show()
 
     # RETURN STATUS
     # ///////////////////////////////////////////////////////////////
@@ -79,6 +80,12 @@ class UIFunctions(MainWindow):
             else:
                 widthExtended = standard
 
+            # SNAPSHOT ANIMATION
+            # Slide cached pixmaps, the layout is only computed once for the final width
+            if Settings.MENU_ANIMATION_MODE == "snapshot":
+                UIFunctions.layoutMorph(self).start(lambda: self.ui.leftMenuBg.setMinimumWidth(widthExtended))
+                return
+
             # ANIMATION
             self.animation = QPropertyAnimation(self.ui.leftMenuBg, b"minimumWidth")
             self.animation.setDuration(Settings.TIME_ANIMATION)
@@ -87,6 +94,19 @@ class UIFunctions(MainWindow):
             self.animation.setEasingCurve(QEasingCurve.InOutQuart)
             self.animation.start()
 
+    # Widgets whose geometry changes when the menu or the extra boxes open
+    def animatedWidgets(self):
+        return [self.ui.leftMenuBg, self.ui.extraLeftBox, self.ui.contentTopBg,
+                self.ui.pagesContainer, self.ui.extraRightBox, self.ui.bottomBar]
+
+    # One snapshot morph for the menu and the boxes, a click during a slide retargets it
+    def layoutMorph(self):
+        if getattr(self, "morph", None) is None:
+            self.morph = LayoutMorph(self.ui.bgApp, UIFunctions.animatedWidgets(self),
+                                     Settings.TIME_ANIMATION, QEasingCurve.InOutQuart, self,
+                                     Settings.ANIMATION_FRAME_BUDGET_MS)
+        return self.morph
+
     # TOGGLE LEFT BOX
     # ///////////////////////////////////////////////////////////////
     def toggleLeftBox(self, enable):
@@ -160,6 +180,15 @@ class UIFunctions(MainWindow):
         else:
             right_width = 0
 
+        # SNAPSHOT ANIMATION
+        # The boxes slide as cached pixmaps, layout only runs before and after
+        if Settings.BOX_ANIMATION_MODE == "snapshot":
+            def commit():
+                self.ui.extraLeftBox.setMinimumWidth(left_width)
+                self.ui.extraRightBox.setMinimumWidth(right_width)
+            UIFunctions.layoutMorph(self).start(commit)
+            return
+
         # ANIMATION LEFT BOX
         self.left_box = QPropertyAnimation(self.ui.extraLeftBox, b"minimumWidth")
         self.left_box.setDuration(Settings.TIME_ANIMATION)
@@ -178,6 +207,8 @@ class UIFunctions(MainWindow):
         self.group = QParallelAnimationGroup()
         self.group.addAnimation(self.left_box)
         self.group.addAnimation(self.right_box)
+        if Settings.ANIMATION_FRAME_BUDGET_MS:
+            FrameBudget(self.group, self.left_box.valueChanged, Settings.ANIMATION_FRAME_BUDGET_MS)
         self.group.start()
 
     # SELECT/DESELECT MENU
@@ -213,7 +244,7 @@ class UIFunctions(MainWindow):
 
     # START - GUI DEFINITIONS
     # ///////////////////////////////////////////////////////////////
-    def uiDefinitions(self):
+    def uiDefinitions(self, deferDecorations=False):
         def dobleClickMaximizeRestore(event):
             # IF DOUBLE CLICK CHANGE STATUS
             if event.type() == QEvent.MouseButtonDblClick:
@@ -273,12 +304,6 @@ class UIFunctions(MainWindow):
             self.ui.titleRightInfo.mouseMoveEvent = moveWindow
             self.ui.titleRightInfo.mouseReleaseEvent = releaseMouse
 
-            # CUSTOM GRIPS
-            self.left_grip = CustomGrip(self, Qt.LeftEdge, True)
-            self.right_grip = CustomGrip(self, Qt.RightEdge, True)
-            self.top_grip = CustomGrip(self, Qt.TopEdge, True)
-            self.bottom_grip = CustomGrip(self, Qt.BottomEdge, True)
-
         else:
             self.ui.appMargins.setContentsMargins(0, 0, 0, 0)
             self.ui.minimizeAppBtn.hide()
@@ -286,13 +311,11 @@ class UIFunctions(MainWindow):
             self.ui.closeAppBtn.hide()
             self.ui.frame_size_grip.hide()
 
-        # DROP SHADOW
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(17)
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(0)
-        self.shadow.setColor(QColor(0, 0, 0, 150))
-        self.ui.bgApp.setGraphicsEffect(self.shadow)
+        # CUSTOM GRIPS AND DROP SHADOW
+        # Deferred callers run "setupGrips" and "setupShadow" after the first paint
+        if not deferDecorations:
+            UIFunctions.setupGrips(self)
+            UIFunctions.setupShadow(self)
 
         # RESIZE WINDOW
         self.sizegrip = QSizeGrip(self.ui.frame_size_grip)
@@ -307,8 +330,36 @@ class UIFunctions(MainWindow):
         # CLOSE APPLICATION
         self.ui.closeAppBtn.clicked.connect(lambda: self.close())
 
-    def resize_grips(self):
+    # CUSTOM GRIPS
+    # ///////////////////////////////////////////////////////////////
+    def setupGrips(self):
         if Settings.ENABLE_CUSTOM_TITLE_BAR:
+            self.left_grip = CustomGrip(self, Qt.LeftEdge, True)
+            self.right_grip = CustomGrip(self, Qt.RightEdge, True)
+            self.top_grip = CustomGrip(self, Qt.TopEdge, True)
+            self.bottom_grip = CustomGrip(self, Qt.BottomEdge, True)
+
+            # GRIPS CREATED AFTER "show()" ARE NOT SHOWN WITH THE WINDOW
+            UIFunctions.resize_grips(self)
+            for grip in UIFunctions.grips(self):
+                grip.setVisible(not GLOBAL_STATE)
+
+    def grips(self):
+        return [grip for grip in (getattr(self, name, None) for name in
+                ("left_grip", "right_grip", "top_grip", "bottom_grip")) if grip is not None]
+
+    # DROP SHADOW
+    # ///////////////////////////////////////////////////////////////
+    def setupShadow(self):
+        self.shadow = QGraphicsDropShadowEffect(self)
+        self.shadow.setBlurRadius(17)
+        self.shadow.setXOffset(0)
+        self.shadow.setYOffset(0)
+        self.shadow.setColor(QColor(0, 0, 0, 150))
+        self.ui.bgApp.setGraphicsEffect(self.shadow)
+
+    def resize_grips(self):
+        if Settings.ENABLE_CUSTOM_TITLE_BAR and UIFunctions.grips(self):
             self.left_grip.setGeometry(0, 10, 10, self.height())
             self.right_grip.setGeometry(self.width() - 10, 10, 10, self.height())
             self.top_grip.setGeometry(0, 0, self.width(), 10)
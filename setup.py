@@ -1,15 +1,37 @@
 import sys
 import os
+import glob
+import json
+import time
+import tempfile
+import subprocess
 from cx_Freeze import setup, Executable
 
 # ADD FILES
-files = ['icon.ico','themes/']
+files = ['icon.ico','themes/', ('modules/resources.rcc', 'resources.rcc')]
+
+# QT MODULES
+# Only the three Qt modules the app imports are frozen, the rest of PyQt5 is excluded
+QT_INCLUDES = ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets']
+QT_EXCLUDES = [
+    'PyQt5.Qt', 'PyQt5.QtBluetooth', 'PyQt5.QtDBus', 'PyQt5.QtDesigner', 'PyQt5.QtHelp',
+    'PyQt5.QtLocation', 'PyQt5.QtMultimedia', 'PyQt5.QtMultimediaWidgets', 'PyQt5.QtNetwork',
+    'PyQt5.QtNfc', 'PyQt5.QtOpenGL', 'PyQt5.QtPositioning', 'PyQt5.QtPrintSupport', 'PyQt5.QtQml',
+    'PyQt5.QtQuick', 'PyQt5.QtQuickWidgets', 'PyQt5.QtRemoteObjects', 'PyQt5.QtSensors',
+    'PyQt5.QtSerialPort', 'PyQt5.QtSql', 'PyQt5.QtSvg', 'PyQt5.QtTest', 'PyQt5.QtTextToSpeech',
+    'PyQt5.QtWebChannel', 'PyQt5.QtWebEngine', 'PyQt5.QtWebEngineCore', 'PyQt5.QtWebEngineWidgets',
+    'PyQt5.QtWebSockets', 'PyQt5.QtX11Extras', 'PyQt5.QtXml', 'PyQt5.QtXmlPatterns', 'PyQt5.uic',
+]
+# STANDARD LIBRARY PACKAGES THE APP NEVER IMPORTS
+STDLIB_EXCLUDES = ['tkinter', 'unittest', 'test', 'pydoc_data', 'lib2to3', 'idlelib',
+                   'xmlrpc', 'curses', 'sqlite3', 'ensurepip', 'turtledemo']
 
 # TARGET
+# "Win32GUI" hides the console on Windows, Linux and macOS use the default base
 target = Executable(
     script="main.py",
-    base="Win32GUI",
-    icon="icon.ico"
+    base="Win32GUI" if sys.platform == "win32" else None,
+    icon="icon.ico" if sys.platform == "win32" else None
 )
 
 # SETUP CX FREEZE
@@ -19,7 +41,76 @@ setup(
     description = "Modern GUI for Python applications",
     author = "Wanderson M. Pimenta",
     options = {'build_exe' : {'include_files' : files,
-                             'packages': ['PyQt5'],
-                             'includes': ['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets']}},
+                             'includes': QT_INCLUDES,
+                             'excludes': QT_EXCLUDES + STDLIB_EXCLUDES,
+                             # -OO bytecode, pure Python packages zipped, PyQt5 keeps its plugins on disk
+                             'optimize': 2,
+                             'zip_include_packages': ['*'],
+                             'zip_exclude_packages': ['PyQt5']}},
     executables = [target]
 )
+
+# BUILD REPORT
+# ///////////////////////////////////////////////////////////////
+def directory_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, names in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in names)
+    return total
+
+def print_size_breakdown(build_dir):
+    """Print the size of every top level entry of the build, largest first"""
+    sizes = [(directory_size(os.path.join(build_dir, name)), name) for name in os.listdir(build_dir)]
+    # PyQt5 usually dominates, show its own breakdown too
+    pyqt_dir = os.path.join(build_dir, 'lib', 'PyQt5')
+    if os.path.isdir(pyqt_dir):
+        sizes += [(directory_size(os.path.join(pyqt_dir, name)), os.path.join('lib', 'PyQt5', name))
+                  for name in os.listdir(pyqt_dir)]
+
+    total = directory_size(build_dir)
+    print(f"\nBuild size: {total / 1048576:.1f} MiB ({build_dir})")
+    for size, name in sorted(sizes, reverse=True)[:25]:
+        print(f"  {size / 1048576:8.2f} MiB  {size * 100 / max(total, 1):5.1f}%  {name}")
+
+def smoke_test(build_dir):
+    """Start the frozen app offscreen and time it until the startup profile is written"""
+    executable = os.path.join(build_dir, 'main.exe' if sys.platform == 'win32' else 'main')
+    if not os.path.exists(executable):
+        print(f"Smoke test skipped: {executable} not found.")
+        return True
+
+    fd, profile_file = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    try:
+        start = time.perf_counter()
+        result = subprocess.run([executable, '--profile-startup', profile_file, '--profile-quit'],
+                                env=env, timeout=120)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            print(f"Smoke test failed: exit code {result.returncode}.")
+            return False
+
+        with open(profile_file, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+        print(f"\nSmoke test: frozen startup {elapsed:.0f} ms wall clock, "
+              f"{profile['total_ms']:.0f} ms to fully initialized")
+        for name, phase in profile['phases'].items():
+            print(f"  {phase['duration_ms']:8.1f} ms  {name}")
+        return True
+
+    except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+        print(f"Smoke test failed: {str(e)}")
+        return False
+
+    finally:
+        os.remove(profile_file)
+
+if any(command in sys.argv for command in ('build', 'build_exe')):
+    builds = sorted(glob.glob(os.path.join('build', 'exe.*')), key=os.path.getmtime)
+    if builds:
+        print_size_breakdown(builds[-1])
+        if not os.environ.get('PYDRACULA_SKIP_SMOKE_TEST') and not smoke_test(builds[-1]):
+            sys.exit(1)
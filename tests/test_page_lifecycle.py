@@ -0,0 +1,117 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from PyQt5.QtCore import QElapsedTimer, QTimer
+    from PyQt5.QtWidgets import QApplication, QWidget
+except ImportError:
+    QApplication = None
+
+class Worker(object):
+    """A stream stand-in that records when it is started"""
+    def __init__(self):
+        self.running = True
+        self.starts = 0
+
+    def start(self):
+        self.running = True
+        self.starts += 1
+
+    def stop(self):
+        self.running = False
+
+    def isRunning(self):
+        return self.running
+
+@unittest.skipIf(QApplication is None, "PyQt5 is not installed")
+class HiddenPageSuspenderTest(unittest.TestCase):
+    """A page skipped by a retargeted slide keeps its workers stopped"""
+    SPEED_MS = 200
+
+    def setUp(self):
+        from widgets.sliding_stacked_widgets import SlidingStackedWidget
+        from widgets.page_lifecycle import HiddenPageSuspender
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.stack = SlidingStackedWidget()
+        self.stack.resize(400, 300)
+        self.stack.setSpeed(self.SPEED_MS)
+        self.pages = {}
+        for name in ("home", "widgets", "new_page"):
+            self.pages[name] = QWidget()
+            self.stack.addWidget(self.pages[name])
+        self.stack.show()
+        self.app.processEvents()
+
+        self.suspender = HiddenPageSuspender(self.stack)
+        self.timer = QTimer()
+        self.timer.setInterval(10)
+        self.timer.start()
+        self.worker = Worker()
+        self.suspender.register(self.pages["widgets"], self.timer)
+        self.suspender.register(self.pages["widgets"], self.worker)
+
+        # QTimer has no started signal, so its state is sampled while the slides run
+        self.timer_active = []
+        self.probe = QTimer()
+        self.probe.setInterval(1)
+        self.probe.timeout.connect(lambda: self.timer_active.append(self.timer.isActive()))
+        self.probe.start()
+
+    def tearDown(self):
+        self.probe.stop()
+        self.timer.stop()
+        self.stack.deleteLater()
+        self.app.processEvents()
+
+    def runFor(self, ms):
+        clock = QElapsedTimer()
+        clock.start()
+        while clock.elapsed() < ms:
+            self.app.processEvents()
+
+    def assertNeverResumed(self):
+        self.assertFalse(any(self.timer_active))
+        self.assertEqual(self.worker.starts, 0)
+        self.assertTrue(self.suspender.isSuspended(self.timer))
+        self.assertTrue(self.suspender.isSuspended(self.worker))
+
+    def rapidSequence(self, after_ms):
+        self.stack.slideInWgt(self.pages["widgets"])
+        self.runFor(after_ms)
+        self.stack.slideInWgt(self.pages["new_page"])
+        self.runFor(self.SPEED_MS * 3)
+        self.assertIs(self.stack.currentWidget(), self.pages["new_page"])
+
+    def testSkippedPastHalfway(self):
+        self.rapidSequence(self.SPEED_MS * 0.7)
+        self.assertNeverResumed()
+
+    def testSkippedBeforeHalfway(self):
+        self.rapidSequence(self.SPEED_MS * 0.2)
+        self.assertNeverResumed()
+
+    def testJumpRetarget(self):
+        self.stack.setRetargetMode("jump")
+        self.rapidSequence(self.SPEED_MS * 0.7)
+        self.assertNeverResumed()
+
+    def testSetCurrentDuringSlide(self):
+        self.stack.slideInWgt(self.pages["widgets"])
+        self.runFor(self.SPEED_MS * 0.7)
+        self.stack.setCurrentWidget(self.pages["new_page"])
+        self.runFor(self.SPEED_MS * 3)
+        self.assertIs(self.stack.currentWidget(), self.pages["new_page"])
+        self.assertNeverResumed()
+
+    def testResumedWhenSettled(self):
+        self.stack.slideInWgt(self.pages["widgets"])
+        self.runFor(self.SPEED_MS * 3)
+        self.assertTrue(self.timer.isActive())
+        self.assertEqual(self.worker.starts, 1)
+
+if __name__ == "__main__":
+    unittest.main()
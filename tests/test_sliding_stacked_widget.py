@@ -0,0 +1,108 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from PyQt5.QtCore import QElapsedTimer
+    from PyQt5.QtWidgets import QApplication, QWidget
+except ImportError:
+    QApplication = None
+
+class Page(QWidget):
+    def __init__(self, name, events):
+        super(Page, self).__init__()
+        self.setObjectName(name)
+        self.events = events
+
+    def on_enter(self):
+        self.events.append("enter " + self.objectName())
+
+    def on_leave(self):
+        self.events.append("leave " + self.objectName())
+
+@unittest.skipIf(QApplication is None, "PyQt5 is not installed")
+class RetargetTest(unittest.TestCase):
+    """A slide retargeted to another page enters and leaves only the pages settled on"""
+    SPEED_MS = 200
+
+    def setUp(self):
+        from widgets.sliding_stacked_widgets import SlidingStackedWidget
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.events = []
+        self.stack = SlidingStackedWidget()
+        self.stack.resize(400, 300)
+        self.stack.setSpeed(self.SPEED_MS)
+        self.pages = {}
+        for name in ("home", "widgets", "new_page"):
+            self.pages[name] = Page(name, self.events)
+            self.stack.addWidget(self.pages[name])
+        self.stack.pageEntered.connect(lambda index: self.events.append("entered " + self.stack.widget(index).objectName()))
+        self.stack.pageLeft.connect(lambda index: self.events.append("left " + self.stack.widget(index).objectName()))
+        self.stack.show()
+
+    def tearDown(self):
+        self.stack.deleteLater()
+        self.app.processEvents()
+
+    def runFor(self, ms):
+        clock = QElapsedTimer()
+        clock.start()
+        while clock.elapsed() < ms:
+            self.app.processEvents()
+
+    def settle(self):
+        self.runFor(self.SPEED_MS * 3)
+        self.assertFalse(self.stack.is_animating)
+
+    def start(self, name):
+        self.stack.setCurrentWidget(self.pages[name])
+        self.app.processEvents()
+        del self.events[:]
+
+    def retarget(self, first, then, after_ms):
+        self.stack.slideInWgt(self.pages[first])
+        self.runFor(after_ms)
+        self.assertTrue(self.stack.is_animating)
+        self.stack.slideInWgt(self.pages[then])
+        self.settle()
+
+    def assertSettled(self, left, entered):
+        self.assertEqual(self.events, ["leave " + left, "left " + left, "enter " + entered, "entered " + entered])
+        self.assertIs(self.stack.currentWidget(), self.pages[entered])
+
+    def testRetargetPastHalfway(self):
+        self.start("new_page")
+        self.retarget("home", "widgets", self.SPEED_MS * 0.7)
+        self.assertSettled("new_page", "widgets")
+
+    def testRetargetBeforeHalfway(self):
+        self.start("new_page")
+        self.retarget("home", "widgets", self.SPEED_MS * 0.2)
+        self.assertSettled("new_page", "widgets")
+
+    def testRetargetSnapshot(self):
+        self.stack.setTransitionMode("snapshot")
+        self.start("home")
+        self.retarget("widgets", "new_page", self.SPEED_MS * 0.7)
+        self.assertSettled("home", "new_page")
+
+    def testRetargetBackToStart(self):
+        self.start("home")
+        self.retarget("widgets", "home", self.SPEED_MS * 0.7)
+        self.assertEqual(self.events, [])
+        self.assertIs(self.stack.currentWidget(), self.pages["home"])
+
+    def testRetargetStartsWhereThePageIs(self):
+        self.start("new_page")
+        self.stack.slideInWgt(self.pages["home"])
+        self.runFor(self.SPEED_MS * 0.7)
+        position = self.pages["home"].pos()
+        self.stack.slideInWgt(self.pages["widgets"])
+        self.assertEqual(self.pages["home"].pos(), position)
+        self.settle()
+
+if __name__ == "__main__":
+    unittest.main()
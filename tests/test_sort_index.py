@@ -0,0 +1,75 @@
+import os
+import sys
+import random
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from PyQt5.QtCore import QCoreApplication, QElapsedTimer, QTimer
+except ImportError:
+    QCoreApplication = None
+
+@unittest.skipIf(QCoreApplication is None, "PyQt5 is not installed")
+class SortResponsivenessTest(unittest.TestCase):
+    """Sorting in the SortIndex worker must not freeze the GUI event loop"""
+    ROWS = 1000000
+    TICK_MS = 5
+    MAX_FREEZE_MS = 150
+
+    def setUp(self):
+        from widgets.data_table import sort_index
+        self.sort_index = sort_index
+        self.app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+        random.seed(1)
+
+    def sortWhileTicking(self, store, column):
+        """Sort on the worker thread while a timer ticks, return (order, longest gap in ms)"""
+        index = self.sort_index.SortIndex(store)
+        jobs = []
+        index.orderReady.connect(jobs.append)
+        gaps = []
+        clock = QElapsedTimer()
+
+        def tick():
+            gaps.append(clock.restart())
+            if jobs or (index.worker is not None and not index.worker.is_alive()):
+                self.app.quit()
+        timer = QTimer()
+        timer.setInterval(self.TICK_MS)
+        timer.timeout.connect(tick)
+        timer.start()
+        clock.start()
+        index.request(column)
+        self.app.exec_()
+        timer.stop()
+        index.worker.join()
+        return jobs[0]["ids"], max(gaps)
+
+    def assertResponsive(self, store, column):
+        ids, freeze = self.sortWhileTicking(store, column)
+        values = store.columns[column]
+        expected = sorted(range(self.ROWS), key=values.get)
+        self.assertEqual(list(ids), expected)
+        self.assertLess(freeze, self.MAX_FREEZE_MS)
+
+    def testTextSort(self):
+        from widgets.data_table import ColumnStore
+        store = ColumnStore.fromSchema([("text", "s")])
+        store.appendColumns([["%08x" % random.getrandbits(32) for _ in range(self.ROWS)]])
+        self.assertResponsive(store, 0)
+
+    def testNumberSortWithoutNumpy(self):
+        from widgets.data_table import ColumnStore
+        store = ColumnStore.fromSchema([("number", "d")])
+        store.appendColumns([[random.random() for _ in range(self.ROWS)]])
+        loaded = self.sort_index._numpy
+        self.sort_index._numpy = None
+        try:
+            self.assertResponsive(store, 0)
+        finally:
+            self.sort_index._numpy = loaded
+
+if __name__ == "__main__":
+    unittest.main()
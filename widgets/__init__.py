@@ -15,3 +15,6 @@
 # ///////////////////////////////////////////////////////////////
 
 from . custom_grips import CustomGrip
+from . log_console import LogConsole
+from . page_lifecycle import PageLifecycleManager, HiddenPageSuspender
+from . snapshot_overlay import SnapshotOverlay, FrameBudget, LayoutMorph
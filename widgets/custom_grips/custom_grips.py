@@ -14,9 +14,9 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+from PyQt5.QtCore import Qt, QRect, QSize
+from PyQt5.QtGui import QCursor
+from PyQt5.QtWidgets import QWidget, QFrame, QHBoxLayout, QSizeGrip
 
 class CustomGrip(QWidget):
     def __init__(self, parent, position, disable_color = False):
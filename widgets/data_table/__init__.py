@@ -0,0 +1,8 @@
+from . column_store import ColumnStore, NumberColumn, TextColumn
+from . data_table import DataTable, DataTableModel
+from . display_cache import DisplayCache
+from . file_source import CsvSource, FileSource, FixedWidthSource, openFileSource
+from . row_stream import RowStream
+from . search_index import SearchIndex
+from . sort_index import SortIndex
+from . table_export import TableExport
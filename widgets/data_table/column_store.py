@@ -0,0 +1,126 @@
+from array import array
+from itertools import accumulate
+
+class NumberColumn():
+    """Numeric column stored in a flat array.array buffer"""
+    def __init__(self, name, typecode="d"):
+        self.name = name
+        self.typecode = typecode
+        self.values = array(typecode)
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, row):
+        return self.values[row]
+
+    def append(self, value):
+        self.values.append(value)
+
+    def extend(self, values):
+        self.values.extend(values)
+
+    def removeFirst(self, count):
+        del self.values[:count]
+
+    def copy(self):
+        column = NumberColumn(self.name, self.typecode)
+        column.values = self.values[:]
+        return column
+
+class TextColumn():
+    """Text column stored as one UTF-8 buffer plus an array of end offsets"""
+    def __init__(self, name):
+        self.name = name
+        self.typecode = "s"
+        self.data = bytearray()
+        # Offsets are absolute, "base" is the offset of data[0] after evictions
+        self.offsets = array("Q", [0])
+        self.base = 0
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get(self, row):
+        return self.data[self.offsets[row] - self.base:self.offsets[row + 1] - self.base].decode("utf-8")
+
+    def append(self, value):
+        self.data += str(value).encode("utf-8")
+        self.offsets.append(self.base + len(self.data))
+
+    def extend(self, values):
+        encoded = [str(value).encode("utf-8") for value in values]
+        ends = accumulate(map(len, encoded), initial=self.offsets[-1])
+        next(ends)
+        self.offsets.extend(ends)
+        self.data += b"".join(encoded)
+
+    def removeFirst(self, count):
+        del self.data[:self.offsets[count] - self.base]
+        self.base = self.offsets[count]
+        del self.offsets[:count]
+
+    def copy(self):
+        column = TextColumn(self.name)
+        column.data = bytearray(self.data)
+        column.offsets = self.offsets[:]
+        column.base = self.base
+        return column
+
+class ColumnStore():
+    """Row data kept column by column, no Python object per cell"""
+    SORTABLE = True
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        # Rows dropped from the front so far, row + evicted is a stable row id
+        self.evicted = 0
+
+    @classmethod
+    def fromSchema(cls, schema):
+        """Create a store from (name, typecode) pairs, typecode "s" is text"""
+        return cls(TextColumn(name) if typecode == "s" else NumberColumn(name, typecode)
+                   for name, typecode in schema)
+
+    def rowCount(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def columnCount(self):
+        return len(self.columns)
+
+    def columnName(self, column):
+        return self.columns[column].name
+
+    def isNumeric(self, column):
+        return self.columns[column].typecode != "s"
+
+    def value(self, row, column):
+        return self.columns[column].get(row)
+
+    def rowValues(self, row):
+        return [column.get(row) for column in self.columns]
+
+    def copy(self):
+        store = ColumnStore(column.copy() for column in self.columns)
+        store.evicted = self.evicted
+        return store
+
+    def appendRow(self, values):
+        for column, value in zip(self.columns, values):
+            column.append(value)
+
+    def appendRows(self, rows):
+        # Transpose once so every column is extended in a single call
+        if rows:
+            self.appendColumns(zip(*rows))
+
+    def appendColumns(self, columns):
+        """Append a block given as one sequence per column"""
+        for column, values in zip(self.columns, columns):
+            column.extend(values)
+
+    def removeFirstRows(self, count):
+        count = min(count, self.rowCount())
+        for column in self.columns:
+            column.removeFirst(count)
+        self.evicted += count
@@ -0,0 +1,398 @@
+import random
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QAbstractScrollArea, QFrame
+
+from . column_store import ColumnStore
+from . display_cache import DisplayCache
+from . search_index import SearchIndex, normalizeText, rowSearchText
+from . sort_index import SortIndex
+
+class DataTableModel(QAbstractTableModel):
+    """Table model over a column store, cells are formatted only when a view asks"""
+    REFRESH_ORDER_MS = 250
+    # Emitted by setSource, unlike modelReset which a sort or search also emits
+    sourceChanged = pyqtSignal()
+
+    def __init__(self, source=None, parent=None, cache_entries=20000):
+        super(DataTableModel, self).__init__(parent)
+        self.source = source if source is not None else ColumnStore([])
+
+        # Formatted text by (stable row id, column, version), see invalidateDisplay
+        self.version = 0
+        self.displayCache = DisplayCache(cache_entries)
+
+        # View order: None is store order, else an array of stable row ids
+        self.order = None
+        self.sortColumn = None
+        self.sortDescending = False
+        self.rangeFilters = {}
+        self.sortIndex = SortIndex(self.source, self)
+        self.sortIndex.orderReady.connect(self._applyOrder)
+
+        # Search: index created by enableSearch, "searchIds" are the matching stable ids
+        self.searchIndex = None
+        self.searchText = ""
+        self.searchIds = None
+        self.searchEnd = 0
+
+        # Streamed rows are merged into a sorted order at most this often
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setSingleShot(True)
+        self.refreshTimer.setInterval(self.REFRESH_ORDER_MS)
+        self.refreshTimer.timeout.connect(self.refreshOrder)
+
+    def setSource(self, source):
+        self.beginResetModel()
+        self.source = source
+        self.version += 1
+        self.displayCache.clear()
+        self.order = None
+        self.sortIndex.store = source
+        self.sortIndex.invalidate()
+        self.searchIds = None
+        self.endResetModel()
+        # File sources publish rows while their index is being built
+        if hasattr(source, "rowsIndexed"):
+            source.rowsIndexed.connect(self._sourceRowsIndexed)
+        self.sourceChanged.emit()
+        if self.searchIndex is not None:
+            self.buildSearchIndex()
+            self.search(self.searchText)
+        else:
+            self.refreshOrder()
+
+    def _sourceRowsIndexed(self, count):
+        if self.sender() is not self.source:
+            return
+        first = self.source.rowCount()
+        if count <= first:
+            return
+        if self.searchIndex is not None:
+            self.searchIndex.build(self.source.copy(), first, count, self.source.evicted + first)
+        if self.order is not None:
+            # Not in the view order yet, the search below or the next refresh adds them
+            self.source.commitRows(count)
+            if self.searchText:
+                self.search(self.searchText)
+            else:
+                self.refreshTimer.start()
+            return
+        self.beginInsertRows(QModelIndex(), first, count - 1)
+        self.source.commitRows(count)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.source.rowCount() if self.order is None else len(self.order)
+
+    def sourceRow(self, row):
+        """Store row of a view row, negative if the row was evicted since the last refresh"""
+        if self.order is None:
+            return row
+        return self.order[row] - self.source.evicted
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.source.columnCount()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.displayText(self.sourceRow(index.row()), index.column())
+        if role == Qt.TextAlignmentRole and self.source.isNumeric(index.column()):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    # DISPLAY CACHE
+    # ///////////////////////////////////////////////////////////////
+    def displayKey(self, row, column):
+        return (row + self.source.evicted, column, self.version)
+
+    def displayText(self, row, column):
+        """Formatted text of a store row, None for evicted rows"""
+        if row < 0:
+            return None
+        return self.displayCache.text(self.displayKey(row, column),
+                                      lambda: self.formatValue(self.source.value(row, column)))
+
+    def displayWidth(self, row, column, metrics):
+        """Pixel width of the formatted text of a store row, measured once per version"""
+        return self.displayCache.width(self.displayKey(row, column),
+                                       lambda: self.formatValue(self.source.value(row, column)), metrics)
+
+    def invalidateDisplay(self, first=None, last=None):
+        """Call after editing rows first..last (store rows, all when None) so they are formatted again"""
+        self.version += 1
+        if self.rowCount() and self.columnCount():
+            # Store rows are scattered in a sorted view, repaint all of it
+            if first is None or self.order is not None:
+                first, last = 0, self.rowCount() - 1
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1),
+                                  [Qt.DisplayRole])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.source.columnName(section)
+        return str(section + 1)
+
+    def formatValue(self, value):
+        if isinstance(value, float):
+            return f"{value:,.2f}"
+        return str(value)
+
+    def appendRows(self, rows):
+        rows = list(rows)
+        if not rows:
+            return
+        if self.searchIndex is not None:
+            self.searchIndex.addRows(self.source.evicted + self.source.rowCount(), rows)
+        if self.order is not None:
+            self._appendOrderedRows(rows)
+            return
+        first = self.source.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.source.appendRows(rows)
+        self.endInsertRows()
+
+    def removeFirstRows(self, count):
+        count = min(count, self.source.rowCount())
+        if count <= 0:
+            return
+        if self.order is not None:
+            # Evicted ids stay in the order as empty rows until the next refresh
+            self.source.removeFirstRows(count)
+            self.refreshTimer.start()
+        else:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            self.source.removeFirstRows(count)
+            self.endRemoveRows()
+        if self.searchIndex is not None:
+            self.searchIndex.evict(self.source.evicted)
+
+    # SORT AND FILTER
+    # ///////////////////////////////////////////////////////////////
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sortColumn = column if column >= 0 else None
+        self.sortDescending = order == Qt.DescendingOrder
+        self.refreshOrder()
+
+    def setRangeFilter(self, column, low=None, high=None):
+        """Show rows whose value in column is within [low, high], both None clears it"""
+        if low is None and high is None:
+            self.rangeFilters.pop(column, None)
+        else:
+            self.rangeFilters[column] = (low, high)
+        self.refreshOrder()
+
+    def clearFilters(self):
+        self.rangeFilters.clear()
+        self.refreshOrder()
+
+    def activeRangeFilters(self):
+        # Read-only file sources have no columns to sort or filter on, only search
+        return self.rangeFilters if self.source.SORTABLE else {}
+
+    def refreshOrder(self):
+        # Rows added since the last search may match too, search them first
+        if self.searchIds is not None and self.searchEnd != self.source.evicted + self.source.rowCount():
+            self.search(self.searchText)
+            return
+        self.requestOrder()
+
+    def requestOrder(self):
+        sort_column = self.sortColumn if self.source.SORTABLE else None
+        filters = [(column, low, high) for column, (low, high) in self.activeRangeFilters().items()]
+        if sort_column is None and not filters and self.searchIds is None:
+            # An order still being built must not replace store order
+            self.sortIndex.cancel()
+            if self.order is not None:
+                self.beginResetModel()
+                self.order = None
+                self.endResetModel()
+            return
+        self.sortIndex.request(sort_column, self.sortDescending, filters, self.searchIds)
+
+    def acceptsRow(self, values):
+        for column, (low, high) in self.activeRangeFilters().items():
+            value = values[column]
+            if (low is not None and value < low) or (high is not None and value > high):
+                return False
+        return not self.searchText or normalizeText(self.searchText) in rowSearchText(values)
+
+    # SEARCH
+    # ///////////////////////////////////////////////////////////////
+    def enableSearch(self):
+        """Start indexing rows for search, kept up to date as rows are added and evicted"""
+        if self.searchIndex is None:
+            self.searchIndex = SearchIndex(self)
+            self.searchIndex.matchesReady.connect(self._applySearch)
+            self.buildSearchIndex()
+
+    def buildSearchIndex(self):
+        # ColumnStore.copy() is a snapshot the worker can read while rows stream in
+        self.searchIndex.clear(self.source.evicted)
+        self.searchIndex.build(self.source.copy(), 0, self.source.rowCount(), self.source.evicted)
+
+    def search(self, text):
+        """Show only rows containing text (case-insensitive), empty text shows all"""
+        if not text and self.searchIndex is None:
+            return
+        self.enableSearch()
+        self.searchText = text
+        if not text:
+            self.searchIndex.query("")
+            self.searchIds = None
+            self.requestOrder()
+            return
+        self.searchEnd = self.source.evicted + self.source.rowCount()
+        self.searchIndex.query(text)
+
+    def _applySearch(self, generation, text, ids):
+        if generation != self.searchIndex.generation or not text:
+            return
+        self.searchIds = ids
+        self.requestOrder()
+
+    def _appendOrderedRows(self, rows):
+        first_id = self.source.evicted + self.source.rowCount()
+        accepted = [first_id + offset for offset, values in enumerate(rows) if self.acceptsRow(values)]
+        if accepted:
+            first = len(self.order)
+            self.beginInsertRows(QModelIndex(), first, first + len(accepted) - 1)
+            self.source.appendRows(rows)
+            self.order.extend(accepted)
+            self.endInsertRows()
+        else:
+            self.source.appendRows(rows)
+        # Appended rows sit unsorted at the end until the next refresh
+        if self.sortColumn is not None:
+            self.refreshTimer.start()
+
+    def _applyOrder(self, job):
+        self.sortIndex.finish(job)
+        if job["generation"] != self.sortIndex.generation:
+            return
+
+        # Rows streamed in while the worker ran are appended unsorted, file
+        # sources grow by whole chunks and search them again instead
+        ids = job["ids"]
+        current_end = self.source.evicted + self.source.rowCount()
+        tail = job["end"] if job["match"] is None else min(job["end"], self.searchEnd)
+        if self.source.SORTABLE:
+            ids.extend(row_id for row_id in range(max(tail, self.source.evicted), current_end)
+                       if self.acceptsRow(self.source.rowValues(row_id - self.source.evicted)))
+        if current_end != tail or job["first"] != self.source.evicted:
+            self.refreshTimer.start()
+
+        if self.order is not None and len(ids) == len(self.order):
+            self.layoutAboutToBeChanged.emit()
+            self.order = ids
+            self.layoutChanged.emit()
+        else:
+            self.beginResetModel()
+            self.order = ids
+            self.endResetModel()
+
+class DataTable(QTableView):
+    """QTableView with the settings of the Designer "tableWidget" for large models"""
+    SAMPLE_ROWS = 200
+    CELL_PADDING = 20
+
+    def __init__(self, parent=None):
+        super(DataTable, self).__init__(parent)
+        # Sampled column widths, kept until remeasureColumns or a new source
+        self.columnSizing = "stretch"
+        self.columnWidths = {}
+        # An empty source is measured again once its first rows are shown
+        self.measurePending = False
+        self.setFrameShape(QFrame.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.setSizeAdjustPolicy(QAbstractScrollArea.AdjustIgnored)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setShowGrid(True)
+        self.setGridStyle(Qt.SolidLine)
+        self.setWordWrap(False)
+
+        # Fixed row heights keep scrolling independent of the row count
+        header = self.verticalHeader()
+        header.setVisible(False)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(self.fontMetrics().height() + 10)
+
+        header = self.horizontalHeader()
+        header.setDefaultSectionSize(200)
+        header.setStretchLastSection(True)
+
+        # Header clicks call DataTableModel.sort, start unsorted
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+        header.sectionHandleDoubleClicked.connect(self.remeasureColumn)
+
+    def setModel(self, model):
+        super(DataTable, self).setModel(model)
+        # Sort, filter and search resets keep the widths, only a new source is measured
+        model.sourceChanged.connect(self.remeasureColumns)
+        model.rowsInserted.connect(self._measureIfPending)
+        model.modelReset.connect(self._measureIfPending)
+        self.remeasureColumns()
+
+    # COLUMN SIZING
+    # "stretch" splits the width evenly, "sampled" sizes columns to the
+    # visible rows plus a random sample instead of every row
+    # ///////////////////////////////////////////////////////////////
+    def setColumnSizing(self, mode):
+        self.columnSizing = mode
+        header = self.horizontalHeader()
+        if mode == "sampled":
+            header.setSectionResizeMode(QHeaderView.Interactive)
+            self.remeasureColumns()
+        else:
+            header.setSectionResizeMode(QHeaderView.Stretch)
+
+    def sizeHintForColumn(self, column):
+        # Also used by QTableView.resizeColumnToContents
+        if column not in self.columnWidths:
+            self.columnWidths[column] = self.measureColumn(column)
+        return self.columnWidths[column]
+
+    def measureColumn(self, column):
+        model = self.model()
+        rows = model.rowCount()
+        first = max(self.rowAt(0), 0)
+        last = self.rowAt(self.viewport().height() - 1)
+        last = min(rows, first + self.SAMPLE_ROWS) - 1 if last < 0 else last
+        sample = set(range(first, last + 1))
+        sample.update(random.sample(range(rows), min(rows, self.SAMPLE_ROWS)))
+
+        metrics = self.fontMetrics()
+        width = self.horizontalHeader().fontMetrics().horizontalAdvance(str(model.headerData(column, Qt.Horizontal)))
+        for row in sample:
+            row = model.sourceRow(row)
+            if row >= 0:
+                width = max(width, model.displayWidth(row, column, metrics))
+        return width + self.CELL_PADDING
+
+    def remeasureColumn(self, column):
+        self.columnWidths.pop(column, None)
+        if self.columnSizing == "sampled":
+            self.horizontalHeader().resizeSection(column, self.sizeHintForColumn(column))
+
+    def remeasureColumns(self):
+        """Measure every column again from a new sample"""
+        self.columnWidths.clear()
+        self.measurePending = False
+        if self.columnSizing != "sampled" or self.model() is None:
+            return
+        self.measurePending = self.model().rowCount() == 0
+        header = self.horizontalHeader()
+        for column in range(self.model().columnCount()):
+            header.resizeSection(column, self.sizeHintForColumn(column))
+
+    def _measureIfPending(self, *args):
+        if self.measurePending and self.model().rowCount():
+            self.remeasureColumns()
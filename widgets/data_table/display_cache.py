@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+class DisplayCache():
+    """Bounded LRU of formatted cell text and its measured width
+
+    Keys are (row id, column, version): bumping the model version makes every
+    older entry unreachable, they age out of the LRU instead of being cleared.
+    """
+    def __init__(self, max_entries=20000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def text(self, key, format_value):
+        """Cached text for key, format_value() is only called on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+        self.misses += 1
+        text = format_value()
+        self.store(key, [text, None])
+        return text
+
+    def width(self, key, format_value, metrics):
+        """Cached pixel width of the text for key, measured with QFontMetrics once"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.text(key, format_value)
+            entry = self.entries[key]
+        if entry[1] is None:
+            entry[1] = metrics.horizontalAdvance(entry[0])
+        return entry[1]
+
+    def store(self, key, entry):
+        self.entries[key] = entry
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def hitRate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {"entries": len(self.entries), "max_entries": self.max_entries,
+                "hits": self.hits, "misses": self.misses, "hit_rate": self.hitRate()}
@@ -0,0 +1,224 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import threading
+from abc import ABCMeta, abstractmethod
+from array import array
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from . sort_index import loadNumpy
+
+class FileSourceMeta(type(QObject), ABCMeta):
+    """QObject subclasses need their metaclass combined with ABCMeta"""
+
+class FileSource(QObject, metaclass=FileSourceMeta):
+    """Read-only table rows over a memory-mapped file, decoded when a view asks
+
+    Same reading interface as ColumnStore (rowCount, value, ...). Rows become
+    visible through rowsIndexed(count), DataTableModel inserts them on the GUI
+    thread and calls commitRows. Subclasses implement decodeRow.
+    """
+    SORTABLE = False
+    indexProgress = pyqtSignal(int, int)
+    rowsIndexed = pyqtSignal(int)
+    indexFinished = pyqtSignal(int)
+
+    def __init__(self, path, parent=None):
+        super(FileSource, self).__init__(parent)
+        self.path = path
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        # Empty files cannot be mapped
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.names = []
+        self.numeric = []
+        self.rows = 0
+        self.evicted = 0
+        self.worker = None
+        self.cancelled = False
+        self.cachedRow = (None, None)
+
+    def rowCount(self):
+        return self.rows
+
+    def columnCount(self):
+        return len(self.names)
+
+    def columnName(self, column):
+        return self.names[column]
+
+    def isNumeric(self, column):
+        return self.numeric[column]
+
+    def value(self, row, column):
+        # Views ask for a row cell by cell, decode it once
+        cached, values = self.cachedRow
+        if cached != row:
+            values = self.decodeRow(row)
+            self.cachedRow = (row, values)
+        return values[column]
+
+    @abstractmethod
+    def decodeRow(self, row):
+        """Values of row, one per column"""
+
+    def rowValues(self, row):
+        # Uncached, safe to call from a worker thread
+        return self.decodeRow(row)
+
+    def copy(self):
+        # Read-only, the source is its own snapshot
+        return self
+
+    def commitRows(self, count):
+        self.rows = count
+
+    def startIndex(self):
+        self.indexProgress.emit(self.size, self.size)
+        self.rowsIndexed.emit(self.rows)
+        self.indexFinished.emit(self.rows)
+
+    def close(self):
+        self.cancelled = True
+        if self.worker is not None:
+            self.worker.join()
+        if self.size:
+            self.data.close()
+        self.file.close()
+
+class CsvSource(FileSource):
+    """Delimited text, one record per line (quoted line breaks are not supported)"""
+    INDEX_CHUNK = 16 * 1024 * 1024
+    SNIFF_ROWS = 100
+
+    def __init__(self, path, delimiter=",", header=True, encoding="utf-8", parent=None):
+        super(CsvSource, self).__init__(path, parent)
+        self.delimiter = delimiter
+        self.encoding = encoding
+
+        # Line starts, row N spans starts[N]..starts[N + 1]
+        start = 0
+        if header and self.size:
+            start = self.lineEnd(0)
+            self.names = self.parseLine(self.data[0:start])
+        self.starts = array("Q", [start])
+        self.sniffColumns(start)
+
+    def lineEnd(self, pos):
+        end = self.data.find(b"\n", pos)
+        return self.size if end == -1 else end + 1
+
+    def parseLine(self, line):
+        text = line.rstrip(b"\r\n").decode(self.encoding, "replace")
+        return next(csv.reader([text], delimiter=self.delimiter), [])
+
+    def sniffColumns(self, pos):
+        """Column count and numeric columns from the first rows"""
+        sample = []
+        while pos < self.size and len(sample) < self.SNIFF_ROWS:
+            end = self.lineEnd(pos)
+            sample.append(self.parseLine(self.data[pos:end]))
+            pos = end
+        count = max([len(self.names)] + [len(values) for values in sample])
+        self.names += [str(column) for column in range(len(self.names), count)]
+        self.numeric = [False] * count
+        for column in range(count):
+            cells = [values[column] for values in sample if column < len(values) and values[column]]
+            self.numeric[column] = bool(cells) and all(isFloat(cell) for cell in cells)
+
+    def decodeRow(self, row):
+        values = self.parseLine(self.data[self.starts[row]:self.starts[row + 1]])
+        values += [""] * (len(self.names) - len(values))
+        for column, numeric in enumerate(self.numeric):
+            if numeric and values[column]:
+                values[column] = parseNumber(values[column])
+        return values
+
+    def startIndex(self):
+        self.worker = threading.Thread(target=self.buildIndex, daemon=True)
+        self.worker.start()
+
+    def buildIndex(self):
+        """Worker thread: collect line starts chunk by chunk, publishing rows as it goes"""
+        starts = self.starts
+        pos = starts[0]
+        # numpy is optional: newline search over a whole chunk in one call
+        numpy = loadNumpy()
+        while pos < self.size and not self.cancelled:
+            end = min(pos + self.INDEX_CHUNK, self.size)
+            if numpy is not None:
+                chunk = numpy.frombuffer(self.data, dtype=numpy.uint8, count=end - pos, offset=pos)
+                found = numpy.flatnonzero(chunk == 10).astype(numpy.uint64) + numpy.uint64(pos + 1)
+                starts.frombytes(found.tobytes())
+                del chunk
+            else:
+                find = self.data.find
+                newline = find(b"\n", pos, end)
+                while newline != -1:
+                    starts.append(newline + 1)
+                    newline = find(b"\n", newline + 1, end)
+            pos = end
+            self.indexProgress.emit(pos, self.size)
+            self.rowsIndexed.emit(len(starts) - 1)
+
+        if self.cancelled:
+            return
+        # Last line without a trailing newline
+        if starts[-1] < self.size:
+            starts.append(self.size)
+        self.rowsIndexed.emit(len(starts) - 1)
+        self.indexFinished.emit(len(starts) - 1)
+
+class FixedWidthSource(FileSource):
+    """Fixed-size binary records described by struct codes, no index needed"""
+    def __init__(self, path, fields, header_size=0, byteorder="<", encoding="utf-8", parent=None):
+        super(FixedWidthSource, self).__init__(path, parent)
+        self.names = [name for name, code in fields]
+        self.numeric = [code[-1] not in "sc" for name, code in fields]
+        self.record = struct.Struct(byteorder + "".join(code for name, code in fields))
+        self.header_size = header_size
+        self.encoding = encoding
+        self.rows = max(0, self.size - header_size) // self.record.size
+
+    @classmethod
+    def fromSchemaFile(cls, path, schema_file, parent=None):
+        """Schema JSON: {"fields": [[name, struct code], ...], "header_size": 0, "byteorder": "<"}"""
+        with open(schema_file, encoding="utf-8") as f:
+            schema = json.load(f)
+        return cls(path, [tuple(field) for field in schema["fields"]], schema.get("header_size", 0),
+                   schema.get("byteorder", "<"), schema.get("encoding", "utf-8"), parent)
+
+    def decodeRow(self, row):
+        values = list(self.record.unpack_from(self.data, self.header_size + row * self.record.size))
+        for column, value in enumerate(values):
+            if isinstance(value, bytes):
+                values[column] = value.rstrip(b"\0 ").decode(self.encoding, "replace")
+        return values
+
+def openFileSource(path, parent=None):
+    """Binary records when "<path>.schema.json" exists, CSV otherwise"""
+    schema_file = path + ".schema.json"
+    if os.path.exists(schema_file):
+        return FixedWidthSource.fromSchemaFile(path, schema_file, parent)
+    delimiter = "\t" if path.lower().endswith((".tsv", ".tab")) else ","
+    return CsvSource(path, delimiter, parent=parent)
+
+def parseNumber(text):
+    """int or float for numeric text, the text itself otherwise"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+def isFloat(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
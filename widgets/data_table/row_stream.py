@@ -0,0 +1,74 @@
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer
+
+class RowStream(QObject):
+    """Rows pushed from any thread, inserted into a DataTableModel once per frame"""
+    HIDDEN_INTERVAL_MS = 1000
+
+    def __init__(self, model, max_rows=None, frame_ms=16, parent=None):
+        super(RowStream, self).__init__(parent)
+        self.model = model
+        self.max_rows = max_rows
+        self.frame_ms = frame_ms
+        # deque.append/popleft are atomic, producers never take a lock
+        self.queue = deque()
+        self.stats = {"pushed": 0, "inserted": 0, "evicted": 0, "dropped": 0, "frames": 0}
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(frame_ms)
+        self.timer.timeout.connect(self.drain)
+
+    # PRODUCERS (ANY THREAD)
+    # ///////////////////////////////////////////////////////////////
+    def push(self, row):
+        self.queue.append(row)
+
+    def pushMany(self, rows):
+        self.queue.extend(rows)
+
+    # GUI THREAD
+    # ///////////////////////////////////////////////////////////////
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def isRunning(self):
+        return self.timer.isActive()
+
+    def setHidden(self, hidden):
+        """Drain once every HIDDEN_INTERVAL_MS while the table is hidden instead of every frame
+
+        Rows keep going to the capped store, so the queue does not grow while
+        nobody looks at the table.
+        """
+        self.timer.setInterval(self.HIDDEN_INTERVAL_MS if hidden else self.frame_ms)
+
+    def pending(self):
+        return len(self.queue)
+
+    def drain(self):
+        """Insert everything queued so far as one block, then evict over the row cap"""
+        count = len(self.queue)
+        if not count:
+            return
+        popleft = self.queue.popleft
+        batch = [popleft() for _ in range(count)]
+        self.stats["pushed"] += count
+
+        # A batch larger than the cap only keeps its newest rows
+        if self.max_rows and count > self.max_rows:
+            self.stats["dropped"] += count - self.max_rows
+            batch = batch[-self.max_rows:]
+
+        self.model.appendRows(batch)
+        self.stats["inserted"] += len(batch)
+        self.stats["frames"] += 1
+
+        if self.max_rows:
+            # Stored rows, the view only counts the ones shown through a filter or search
+            excess = self.model.source.rowCount() - self.max_rows
+            if excess > 0:
+                self.model.removeFirstRows(excess)
+                self.stats["evicted"] += excess
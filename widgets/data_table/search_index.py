@@ -0,0 +1,188 @@
+import queue
+import threading
+import traceback
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from . column_store import TextColumn
+from . sort_index import loadNumpy, toArray
+
+class SearchIndex(QObject):
+    """Substring search over table rows with a trigram index kept by a worker thread
+
+    Every task (build, appended rows, eviction, query) is queued to a single
+    worker, so a query always sees the rows added before it was made. Row text
+    is kept casefolded in one UTF-8 buffer, one line per row, which also lets
+    queries too short or too common for the trigrams scan it with bytes.find.
+    """
+    CHUNK_ROWS = 65536
+    indexProgress = pyqtSignal(int, int)
+    matchesReady = pyqtSignal(int, str, object)
+
+    def __init__(self, parent=None):
+        super(SearchIndex, self).__init__(parent)
+        self.tasks = queue.Queue()
+        self.generation = 0
+        # Bumped by clear(), build tasks of an older generation read a replaced source
+        self.source_generation = 0
+        self.reset(0)
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    # GUI THREAD
+    # ///////////////////////////////////////////////////////////////
+    def build(self, snapshot, first, end, first_id):
+        """Index rows first..end-1 of a snapshot (ColumnStore.copy() or a read-only source)"""
+        self.tasks.put(("build", snapshot, first, end, first_id, self.source_generation))
+
+    def addRows(self, first_id, rows):
+        self.tasks.put(("rows", first_id, rows))
+
+    def evict(self, evicted):
+        """Forget rows with ids below evicted"""
+        self.tasks.put(("evict", evicted))
+
+    def clear(self, first_id=0):
+        """Forget every row, builds still queued or running for the old rows are dropped"""
+        self.source_generation += 1
+        self.tasks.put(("reset", first_id))
+
+    def query(self, text):
+        """matchesReady(generation, text, ids) is emitted with the ascending ids of matching rows"""
+        self.generation += 1
+        self.tasks.put(("query", self.generation, text))
+        return self.generation
+
+    # WORKER THREAD
+    # ///////////////////////////////////////////////////////////////
+    def _run(self):
+        while True:
+            task = self.tasks.get()
+            try:
+                self._runTask(task)
+            except Exception:
+                # A replaced source may be closed under its build, one failed task must not stop the worker
+                if task[0] != "build" or task[-1] == self.source_generation:
+                    traceback.print_exc()
+
+    def _runTask(self, task):
+        kind = task[0]
+        if kind == "build":
+            self._build(*task[1:])
+        elif kind == "rows":
+            self._index(task[1], task[2])
+        elif kind == "evict":
+            self._evict(task[1])
+        elif kind == "reset":
+            self.reset(task[1])
+        elif kind == "query" and task[1] == self.generation:
+            # Skip queries already replaced by a newer keystroke
+            self.matchesReady.emit(task[1], task[2], self.match(task[2]))
+
+    def reset(self, first_id):
+        self.postings = defaultdict(lambda: array("Q"))
+        self.texts = TextColumn("search")
+        self.first_id = first_id
+        self.compacted = first_id
+
+    def _build(self, snapshot, first, end, first_id, generation):
+        for start in range(first, end, self.CHUNK_ROWS):
+            if generation != self.source_generation:
+                return
+            stop = min(start + self.CHUNK_ROWS, end)
+            self._index(first_id + start - first, [snapshot.rowValues(row) for row in range(start, stop)])
+            self.indexProgress.emit(stop - first, end - first)
+
+    def _index(self, first_id, rows):
+        # Tasks arrive in the order the GUI made them, so rows always follow the indexed ones
+        texts = [rowSearchText(values) for values in rows]
+        self.texts.extend(texts)
+        postings = self.postings
+        for row_id, text in enumerate(texts, first_id):
+            for gram in {text[i:i + 3] for i in range(len(text) - 3)}:
+                postings[gram].append(row_id)
+
+    def _evict(self, evicted):
+        count = min(evicted - self.first_id, len(self.texts))
+        if count <= 0:
+            return
+        self.texts.removeFirst(count)
+        self.first_id += count
+        # Dropping evicted ids from every posting list only pays off now and then
+        if self.first_id - self.compacted > len(self.texts):
+            for gram in list(self.postings):
+                posting = self.postings[gram]
+                del posting[:bisect_right(posting, self.first_id - 1)]
+                if not posting:
+                    del self.postings[gram]
+            self.compacted = self.first_id
+
+    def match(self, text):
+        needle = normalizeText(text)
+        rows = len(self.texts)
+        if not needle:
+            return array("Q", range(self.first_id, self.first_id + rows))
+        grams = {needle[i:i + 3] for i in range(len(needle) - 2)}
+        if grams:
+            lists = [self.postings.get(gram) for gram in grams]
+            if not all(lists):
+                return array("Q")
+            smallest = min(lists, key=len)
+            # A vectorized scan beats checking many candidates one by one
+            if len(smallest) <= rows // (32 if loadNumpy() is not None else 8):
+                return self.verify(smallest, needle.encode("utf-8"))
+        return self.scan(needle.encode("utf-8"))
+
+    def verify(self, candidates, needle):
+        """Candidate ids whose row text contains needle"""
+        data, offsets, base = self.texts.data, self.texts.offsets, self.texts.base
+        first = bisect_right(candidates, self.first_id - 1)
+        ids = array("Q")
+        for row_id in candidates[first:]:
+            row = row_id - self.first_id
+            if data.find(needle, offsets[row] - base, offsets[row + 1] - base) != -1:
+                ids.append(row_id)
+        return ids
+
+    def scan(self, needle):
+        """Ids of rows containing needle, one bytes.find per matching row"""
+        data, offsets, base = self.texts.data, self.texts.offsets, self.texts.base
+        if loadNumpy() is not None:
+            return toArray(self.scanVectorized(needle))
+        ids = array("Q")
+        find = data.find
+        position = find(needle)
+        while position != -1:
+            row = bisect_right(offsets, position + base) - 1
+            ids.append(row + self.first_id)
+            position = find(needle, offsets[row + 1] - base)
+        return ids
+
+    def scanVectorized(self, needle):
+        numpy = loadNumpy()
+        # Views on the buffers must be gone before the next extend, keep them local
+        data = numpy.frombuffer(self.texts.data, dtype=numpy.uint8)
+        count = len(data) - len(needle) + 1
+        if count <= 0:
+            return numpy.empty(0, dtype=numpy.uint64)
+        # Narrow the positions of the first byte down byte by byte, each pass is smaller
+        positions = numpy.flatnonzero(data[:count] == needle[0])
+        for shift in range(1, len(needle)):
+            positions = positions[data[positions + shift] == needle[shift]]
+        positions = positions.astype(numpy.uint64) + numpy.uint64(self.texts.base)
+        offsets = numpy.frombuffer(self.texts.offsets, dtype=numpy.uint64)
+        rows = numpy.searchsorted(offsets, positions, side="right") - 1
+        del data, offsets
+        # Positions are ascending, keep the first hit of every row
+        if len(rows):
+            rows = rows[numpy.concatenate(([True], rows[1:] != rows[:-1]))]
+        return rows.astype(numpy.uint64) + numpy.uint64(self.first_id)
+
+def normalizeText(text):
+    return text.casefold().replace("\n", " ")
+
+def rowSearchText(values):
+    """Casefolded text of a row as searched, one line with cells separated by a tab"""
+    return normalizeText("\t".join(map(str, values))) + "\n"
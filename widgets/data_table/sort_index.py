@@ -0,0 +1,189 @@
+import heapq
+import threading
+from array import array
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# numpy is optional: argsort and masks run without the GIL when it is installed.
+# It is imported on first use, importing it with the app would slow down startup
+_numpy = False
+
+# Rows sorted per sorted() call, which holds the GIL until it returns
+SORT_CHUNK_ROWS = 32768
+
+class SortIndex(QObject):
+    """Per-column sort permutations built in a worker thread
+
+    Permutations hold stable row ids (row + store.evicted), so evicted rows
+    are dropped and streamed rows merged in without starting over: the cached
+    permutation followed by the new ids is almost sorted, which the stable
+    sort handles in close to linear time.
+    """
+    orderReady = pyqtSignal(object)
+
+    def __init__(self, store, parent=None):
+        super(SortIndex, self).__init__(parent)
+        self.store = store
+        self.permutations = {}
+        self.generation = 0
+        self.worker = None
+        self.pending = None
+
+    def request(self, column, descending=False, filters=(), match=None):
+        """Build the view order, orderReady(job) is emitted on the GUI thread
+
+        match, if given, is an ascending array of the only row ids to keep.
+        """
+        self.generation += 1
+        job = {
+            "generation": self.generation,
+            "column": column,
+            "descending": descending,
+            "first": self.store.evicted,
+            "end": self.store.evicted + self.store.rowCount(),
+            # Snapshots are taken here so the worker never reads columns being appended to
+            "keys": self.store.columns[column].copy() if column is not None else None,
+            "cached": self.permutations.get(column),
+            "filters": [(self.store.columns[c].copy(), low, high) for c, low, high in filters],
+            "match": match,
+        }
+        if self.worker is not None and self.worker.is_alive():
+            self.pending = job
+            return
+        self._startWorker(job)
+
+    def _startWorker(self, job):
+        self.worker = threading.Thread(target=self._run, args=(job,), daemon=True)
+        self.worker.start()
+
+    def _run(self, job):
+        first, end = job["first"], job["end"]
+        ids = None
+        if job["column"] is not None:
+            ids = sortedIds(job["keys"], first, end, job["cached"])
+            job["sorted"] = ids
+        for column, low, high in job["filters"]:
+            ids = filterIds(column, first, end, ids, low, high)
+        if job["match"] is not None:
+            ids = matchIds(job["match"], first, end, ids)
+        if ids is None:
+            ids = array("Q", range(first, end))
+        elif job["descending"] and job["column"] is not None:
+            ids = ids[::-1]
+        job["ids"] = toArray(ids)
+        self.orderReady.emit(job)
+
+    def finish(self, job):
+        """Called by the model once it applied a result (GUI thread)"""
+        if "sorted" in job:
+            self.permutations[job["column"]] = (job["sorted"], job["end"])
+        if self.pending is not None:
+            job, self.pending = self.pending, None
+            self._startWorker(job)
+
+    def cancel(self):
+        """Drop the queued job and make the running one stale, its result is not applied"""
+        self.generation += 1
+        self.pending = None
+
+    def invalidate(self):
+        self.permutations.clear()
+
+def loadNumpy():
+    """The numpy module, None when it is not installed"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+def toArray(ids):
+    """Return ids as array('Q') without a Python object per element"""
+    numpy = loadNumpy()
+    if isinstance(ids, array):
+        return ids
+    if numpy is not None and isinstance(ids, numpy.ndarray):
+        return array("Q", numpy.ascontiguousarray(ids, dtype=numpy.uint64).tobytes())
+    return array("Q", ids)
+
+def sortedIds(keys, first, end, cached=None):
+    """Ascending stable ids of rows first..end-1 ordered by keys (a detached column)"""
+    numpy = loadNumpy()
+    ids = None
+    if cached is not None:
+        cached_ids, cached_end = cached
+        # Live cached ids first (already in order), then the rows streamed in since
+        if numpy is not None:
+            cached_ids = numpy.asarray(cached_ids, dtype=numpy.uint64)
+            ids = numpy.concatenate([cached_ids[cached_ids >= first],
+                                     numpy.arange(max(cached_end, first), end, dtype=numpy.uint64)])
+        else:
+            ids = array("Q", (i for i in cached_ids if i >= first))
+            ids.extend(range(max(cached_end, first), end))
+
+    if numpy is not None and keys.typecode != "s":
+        values = numpy.frombuffer(keys.values, dtype=keys.typecode)
+        if ids is None:
+            return numpy.argsort(values, kind="stable").astype(numpy.uint64) + numpy.uint64(first)
+        return ids[numpy.argsort(values[(ids - numpy.uint64(first)).astype(numpy.int64)], kind="stable")]
+
+    key = keys.get if keys.typecode == "s" else keys.values.__getitem__
+    return array("Q", (row + first for row in mergeSortedRows(key, end - first, ids, first)))
+
+def mergeSortedRows(key, count, ids=None, first=0):
+    """Rows (ids - first, or 0..count-1 when ids is None) ordered by key(row), ties by row
+
+    One sorted() over every row would hold the GIL for seconds and freeze the
+    GUI thread. Chunks are sorted separately and merged by a generator, so the
+    interpreter can switch threads between steps.
+    """
+    if ids is not None:
+        count = len(ids)
+    runs = []
+    for start in range(0, count, SORT_CHUNK_ROWS):
+        stop = min(start + SORT_CHUNK_ROWS, count)
+        rows = range(start, stop) if ids is None else (int(i) - first for i in ids[start:stop])
+        runs.append(sorted([(key(row), row) for row in rows]))
+    for value, row in heapq.merge(*runs):
+        yield row
+    # Freeing every run at once would hold the GIL as long as a large sort
+    for run in runs:
+        run.clear()
+
+def matchIds(match, first, end, ids):
+    """Keep ids that are in match (ascending), ids None means all rows in store order"""
+    numpy = loadNumpy()
+    if numpy is not None:
+        match = numpy.asarray(match, dtype=numpy.uint64)
+        match = match[(match >= first) & (match < end)]
+        if ids is None:
+            return match
+        ids = numpy.asarray(ids, dtype=numpy.uint64)
+        return ids[numpy.isin(ids, match)]
+    if ids is None:
+        return array("Q", (i for i in match if first <= i < end))
+    keep = set(match)
+    return array("Q", (i for i in ids if i in keep))
+
+def filterIds(keys, first, end, ids, low=None, high=None):
+    """Keep ids whose key is within [low, high], ids None means all rows in store order"""
+    numpy = loadNumpy()
+    if numpy is not None and keys.typecode != "s":
+        values = numpy.frombuffer(keys.values, dtype=keys.typecode)
+        mask = numpy.ones(len(values), dtype=bool)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        if ids is None:
+            return numpy.flatnonzero(mask).astype(numpy.uint64) + numpy.uint64(first)
+        ids = numpy.asarray(ids, dtype=numpy.uint64)
+        return ids[mask[(ids - numpy.uint64(first)).astype(numpy.int64)]]
+
+    def accepted(row):
+        value = keys.get(row)
+        return (low is None or value >= low) and (high is None or value <= high)
+    source = range(first, end) if ids is None else ids
+    return array("Q", (i for i in source if accepted(int(i) - first)))
@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# Binary columnar layout: magic, version, JSON header, then row groups of
+# <u32 rows> and per column <u64 size><bytes> (text: offsets then UTF-8),
+# ended by a group of 0 rows and the <u64 total rows>
+COLUMNAR_MAGIC = b"PDTC"
+COLUMNAR_VERSION = 1
+
+class TableExport(QObject):
+    """Write a DataTableModel to CSV or binary columnar from a worker thread
+
+    Rows are read in chunks straight from the model source, in view order,
+    and written to a temp file next to the target that replaces it only
+    once complete. The source must not change while the export runs.
+    """
+    CHUNK_ROWS = 65536
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, model, path, form_state=None, parent=None):
+        super(TableExport, self).__init__(parent)
+        self.path = path
+        self.form_state = form_state or {}
+        self.binary = not path.lower().endswith((".csv", ".txt"))
+
+        # Captured on the GUI thread, the order array is replaced, never edited, by a sort
+        self.source = model.source
+        self.order = model.order
+        self.evicted = self.source.evicted
+        self.rows = len(self.order) if self.order is not None else self.source.rowCount()
+        self.names = [self.source.columnName(column) for column in range(self.source.columnCount())]
+        self.typecodes = columnTypecodes(self.source)
+        self.worker = None
+        self.cancelled = False
+
+    def start(self):
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def isRunning(self):
+        return self.worker is not None and self.worker.is_alive()
+
+    def _run(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            # Inside the try, "finished" is emitted even when the temp file cannot be created
+            fd, temp_path = tempfile.mkstemp(prefix=".export-", suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "wb") as f:
+                written = self.writeColumnar(f) if self.binary else self.writeCsv(f)
+                if self.cancelled:
+                    raise InterruptedError
+                f.flush()
+                os.fsync(f.fileno())
+            if not self.binary:
+                writeJsonAtomic(self.path + ".form.json", self.form_state)
+            os.replace(temp_path, self.path)
+        except InterruptedError:
+            removeFile(temp_path)
+            self.finished.emit(False, "Export cancelled")
+        except Exception as error:
+            removeFile(temp_path)
+            self.finished.emit(False, f"Export failed: {error}")
+        else:
+            self.finished.emit(True, f"Exported {written:,} rows to {self.path}")
+
+    def chunks(self):
+        """Lists of row values, CHUNK_ROWS at a time, skipping rows evicted before the export"""
+        for first in range(0, self.rows, self.CHUNK_ROWS):
+            if self.cancelled:
+                return
+            last = min(first + self.CHUNK_ROWS, self.rows)
+            if self.order is None:
+                rows = range(first, last)
+            else:
+                rows = [row_id - self.evicted for row_id in self.order[first:last] if row_id >= self.evicted]
+            yield [self.source.rowValues(row) for row in rows]
+            self.progress.emit(last, self.rows)
+
+    def writeCsv(self, f):
+        text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(self.names)
+        written = 0
+        for chunk in self.chunks():
+            writer.writerows(chunk)
+            written += len(chunk)
+        # Hand the binary file back to the caller instead of closing it
+        text.detach()
+        return written
+
+    def writeColumnar(self, f):
+        header = json.dumps({"columns": [[name, typecode] for name, typecode in zip(self.names, self.typecodes)],
+                             "form": self.form_state}).encode("utf-8")
+        f.write(COLUMNAR_MAGIC + struct.pack("<II", COLUMNAR_VERSION, len(header)) + header)
+        written = 0
+        for chunk in self.chunks():
+            # A group of 0 rows ends the file
+            if not chunk:
+                continue
+            f.write(struct.pack("<I", len(chunk)))
+            for values, typecode in zip(zip(*chunk), self.typecodes):
+                for block in encodeColumn(values, typecode):
+                    f.write(struct.pack("<Q", len(block)))
+                    f.write(block)
+            written += len(chunk)
+        f.write(struct.pack("<IQ", 0, written))
+        return written
+
+def columnTypecodes(source):
+    if hasattr(source, "columns"):
+        return [column.typecode for column in source.columns]
+    return ["d" if source.isNumeric(column) else "s" for column in range(source.columnCount())]
+
+def encodeColumn(values, typecode):
+    """Bytes blocks of one column of a row group: the values, or offsets and UTF-8 for text"""
+    if typecode != "s":
+        if typecode in "fd":
+            values = [toFloat(value) for value in values]
+        return [array(typecode, values).tobytes()]
+    data = bytearray()
+    offsets = array("Q")
+    for value in values:
+        data += str(value).encode("utf-8")
+        offsets.append(len(data))
+    return [offsets.tobytes(), bytes(data)]
+
+def toFloat(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+def removeFile(path):
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def writeJsonAtomic(path, data):
+    fd, temp_path = tempfile.mkstemp(prefix=".export-", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    os.replace(temp_path, path)
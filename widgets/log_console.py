@@ -0,0 +1,92 @@
+import threading
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer
+
+class LogConsole(QObject):
+    """Operations log on a QPlainTextEdit: lines written from any thread, rendered once per frame
+
+    Pending lines are kept in a ring buffer of max_lines, so a paused console
+    or a burst faster than the UI only keeps the newest lines. Lines that never
+    reached the widget are counted as dropped, pending lines removed by
+    clear() are counted as cleared.
+    """
+    def __init__(self, edit, max_lines=10000, frame_ms=16, parent=None):
+        super(LogConsole, self).__init__(parent)
+        self.edit = edit
+        self.edit.setReadOnly(True)
+        self.edit.setUndoRedoEnabled(False)
+        self.edit.setMaximumBlockCount(max_lines)
+
+        self.lock = threading.Lock()
+        self.buffer = deque(maxlen=max_lines)
+        self.received = 0
+        self.rendered = 0
+        self.cleared = 0
+        self.paused = False
+        self.autoscroll = True
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(frame_ms)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    # PRODUCERS (ANY THREAD)
+    # ///////////////////////////////////////////////////////////////
+    def log(self, line):
+        with self.lock:
+            self.buffer.append(line)
+            self.received += 1
+
+    def logLines(self, lines):
+        lines = list(lines)
+        with self.lock:
+            self.buffer.extend(lines)
+            self.received += len(lines)
+
+    # GUI THREAD
+    # ///////////////////////////////////////////////////////////////
+    def setPaused(self, paused):
+        self.paused = paused
+        if not paused:
+            self.flush()
+
+    def setAutoscroll(self, autoscroll):
+        self.autoscroll = autoscroll
+        if autoscroll:
+            self.scrollToEnd()
+
+    def clear(self):
+        with self.lock:
+            self.cleared += len(self.buffer)
+            self.buffer.clear()
+        self.edit.clear()
+
+    def flush(self):
+        """Append everything buffered so far as one block of text"""
+        if self.paused or not self.buffer:
+            return
+        with self.lock:
+            lines = list(self.buffer)
+            self.buffer.clear()
+
+        scrollbar = self.edit.verticalScrollBar()
+        position = scrollbar.value()
+        self.edit.appendPlainText("\n".join(lines))
+        self.rendered += len(lines)
+        if self.autoscroll:
+            self.scrollToEnd()
+        else:
+            scrollbar.setValue(position)
+
+    def scrollToEnd(self):
+        scrollbar = self.edit.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def pending(self):
+        return len(self.buffer)
+
+    def stats(self):
+        with self.lock:
+            received, cleared, pending = self.received, self.cleared, len(self.buffer)
+        return {"received": received, "rendered": self.rendered, "pending": pending, "cleared": cleared,
+                "dropped": received - self.rendered - cleared - pending}
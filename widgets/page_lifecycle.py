@@ -0,0 +1,169 @@
+import os
+import time
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QTimer
+
+# psutil is optional: resident memory is read from /proc without it (Linux only)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+class PageLifecycleManager(QObject):
+    """Unload least recently visited lazy pages of a SlidingStackedWidget over a budget
+
+    Budgets are a count of built lazy pages, a resident memory size in MB and
+    a hidden time in seconds (0 disables each). Pages keep lightweight state
+    across an unload through setStateHooks or "save_state()" / "restore_state(state)"
+    methods set on the page by its builder.
+    """
+    CHECK_INTERVAL_MS = 30000
+
+    def __init__(self, stack, max_pages=0, max_memory_mb=0, idle_seconds=0, parent=None):
+        super(PageLifecycleManager, self).__init__(parent)
+        self.stack = stack
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.idle_seconds = idle_seconds
+        # page -> last time it was left, least recently visited first
+        self.visits = OrderedDict()
+        self.states = {}
+        self.hooks = {}
+        self.current = stack.currentWidget()
+        self.unloaded = 0
+
+        stack.currentChanged.connect(self._pageShown)
+        stack.pageBuilt.connect(self._pageBuilt)
+
+        # Idle pages and memory are also checked while no page changes
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.CHECK_INTERVAL_MS)
+        self.timer.timeout.connect(self.enforceBudget)
+        if idle_seconds or max_memory_mb:
+            self.timer.start()
+
+    def setStateHooks(self, page, save, restore):
+        """save() -> state before an unload, restore(state) after the page is built again"""
+        self.hooks[page] = (save, restore)
+
+    def _pageShown(self, index):
+        page = self.stack.widget(index)
+        # The page left behind is stamped now, the shown one moves to the end
+        if self.current in self.visits:
+            self.visits[self.current] = time.monotonic()
+        self.current = page
+        if page in self.stack.page_factories:
+            self.visits.pop(page, None)
+            self.visits[page] = None
+        self.enforceBudget()
+
+    def _pageBuilt(self, index):
+        page = self.stack.widget(index)
+        if page not in self.visits:
+            # Prebuilt pages never shown yet count as the least recently visited
+            self.visits[page] = time.monotonic()
+            self.visits.move_to_end(page, last=False)
+        state = self.states.pop(page, None)
+        if state is None:
+            return
+        restore = self.hooks[page][1] if page in self.hooks else getattr(page, "restore_state", None)
+        if restore is not None:
+            restore(state)
+
+    def builtPages(self):
+        return [page for page in self.visits if self.stack.isPageBuilt(page)]
+
+    def enforceBudget(self):
+        """Unload pages, least recently visited first, until every budget is met"""
+        now = time.monotonic()
+        built = self.builtPages()
+        # Deleted pages only free memory once the event loop runs, so one page per check
+        over_memory = self.max_memory_mb and (processMemoryMB() or 0) > self.max_memory_mb
+        for page in list(built):
+            left = self.visits[page]
+            if left is None:
+                # The shown page is the most recently visited one
+                break
+            over_pages = self.max_pages and len(built) > self.max_pages
+            idle = self.idle_seconds and now - left > self.idle_seconds
+            if (over_pages or over_memory or idle) and self.unload(page):
+                built.remove(page)
+                over_memory = False
+
+    def unload(self, page):
+        save = self.hooks[page][0] if page in self.hooks else getattr(page, "save_state", None)
+        state = save() if save is not None else None
+        if not self.stack.unloadPage(page):
+            return False
+        if state is not None:
+            self.states[page] = state
+        self.unloaded += 1
+        return True
+
+def processMemoryMB():
+    """Resident memory of this process in MB, None where it cannot be read"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+class HiddenPageSuspender(QObject):
+    """Stop the timers and row streams of a page while it is hidden, restart them when it is shown
+
+    Workers are anything with start() and stop() plus isRunning() or isActive()
+    (QTimer). Only workers running when their page is left are restarted, so a
+    worker stopped on purpose stays stopped. Workers with setHidden(hidden)
+    (RowStream) are slowed down instead, so what they queue stays bounded.
+    Pages skipped by a retargeted slide are never entered, so their workers
+    stay stopped.
+    """
+    def __init__(self, stack, parent=None):
+        super(HiddenPageSuspender, self).__init__(parent)
+        self.stack = stack
+        # page -> registered workers / workers stopped when the page was left
+        self.workers = {}
+        self.suspended = {}
+        stack.pageLeft.connect(self._pageLeft)
+        stack.pageEntered.connect(self._resume)
+
+    def register(self, page, worker):
+        self.workers.setdefault(page, []).append(worker)
+        if page is not self.stack.currentWidget():
+            self._suspend(page, [worker])
+
+    def unregister(self, page, worker):
+        if worker in self.workers.get(page, []):
+            self.workers[page].remove(worker)
+        if worker in self.suspended.get(page, []):
+            self.suspended[page].remove(worker)
+            self._wake(worker)
+
+    def isSuspended(self, worker):
+        return any(worker in workers for workers in self.suspended.values())
+
+    def _pageLeft(self, index):
+        page = self.stack.widget(index)
+        self._suspend(page, self.workers.get(page, []))
+
+    def _suspend(self, page, workers):
+        for worker in workers:
+            if hasattr(worker, "setHidden"):
+                worker.setHidden(True)
+            elif worker.isRunning() if hasattr(worker, "isRunning") else worker.isActive():
+                worker.stop()
+            else:
+                continue
+            self.suspended.setdefault(page, []).append(worker)
+
+    def _resume(self, index):
+        for worker in self.suspended.pop(self.stack.widget(index), []):
+            self._wake(worker)
+
+    def _wake(self, worker):
+        if hasattr(worker, "setHidden"):
+            worker.setHidden(False)
+        else:
+            worker.start()
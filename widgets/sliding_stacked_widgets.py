@@ -1,8 +1,17 @@
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+import time
+from PyQt5.QtCore import Qt, QPoint, QRect, QTimer, QEasingCurve, QPropertyAnimation, QVariantAnimation, QParallelAnimationGroup, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QWidget, QStackedWidget
+
+from . snapshot_overlay import SnapshotOverlay
 
 class SlidingStackedWidget(QStackedWidget):
+    pageBuilt = pyqtSignal(int)
+    pageUnloaded = pyqtSignal(int)
+    # Page visibility: entered/left once a transition settles, idle once the event loop is free after it
+    pageEntered = pyqtSignal(int)
+    pageLeft = pyqtSignal(int)
+    pageIdle = pyqtSignal(int)
+
     def __init__(self, parent=None):
         super(SlidingStackedWidget, self).__init__(parent)
 
@@ -11,6 +20,15 @@ class SlidingStackedWidget(QStackedWidget):
         self.animation_speed = 500
         self.animation_curve = QEasingCurve.OutCubic
         self.enable_wrap = False
+        # "live" moves the page widgets, "snapshot" slides pixmaps of them
+        self.transition_mode = "live"
+        self.snapshot_overlay = None
+        # A new target during a slide: "slide" turns it into a short slide, "jump" cuts to it
+        self.retarget_mode = "slide"
+        self.active_widgets = set()
+
+        # Python work done per animation frame, live transitions run no Python per frame
+        self.frame_stats = {"transitions": 0, "frames": 0, "python_ms": 0.0, "max_frame_ms": 0.0}
 
         # State tracking
         self.current_index = 0
@@ -21,6 +39,80 @@ class SlidingStackedWidget(QStackedWidget):
         # Animation group and transition tracking
         self.animation_group = None
         self.active_transition_indices = set()
+        # (current start, current end, next start, next end) of the running slide
+        self.slide_offsets = None
+
+        # Lazy pages: placeholder widget -> builder(page), "page_factories" keeps
+        # every builder so an unloaded page can be built again
+        self.page_builders = {}
+        self.page_factories = {}
+        self._prebuild_timer = None
+
+        # Page lifecycle: pages may define "on_enter()", "on_leave()" and "on_idle()"
+        self.shown_page = None
+        self.currentChanged.connect(self._pageChanged)
+
+    def addLazyWidget(self, builder, name=None):
+        """Add a placeholder page that is filled by builder(page) on first use"""
+        page = QWidget()
+        if name:
+            page.setObjectName(name)
+        self.addWidget(page)
+        self.page_builders[page] = builder
+        self.page_factories[page] = builder
+        return page
+
+    def isPageBuilt(self, widget):
+        return widget not in self.page_builders
+
+    def buildPage(self, widget):
+        """Build a lazy page now, returns True if it was built by this call"""
+        builder = self.page_builders.pop(widget, None)
+        if builder is None:
+            return False
+        builder(widget)
+        self.pageBuilt.emit(self.indexOf(widget))
+        return True
+
+    def unloadPage(self, widget):
+        """Destroy the content of a built lazy page, it is built again on its next use"""
+        if widget not in self.page_factories or not self.isPageBuilt(widget):
+            return False
+        if widget is self.currentWidget() or widget in self.active_widgets:
+            return False
+        for child in widget.findChildren(QWidget, options=Qt.FindDirectChildrenOnly):
+            child.setParent(None)
+            child.deleteLater()
+        if widget.layout() is not None:
+            # A layout is deleted with the temporary widget it is moved to
+            QWidget().setLayout(widget.layout())
+        self.page_builders[widget] = self.page_factories[widget]
+        self.pageUnloaded.emit(self.indexOf(widget))
+        return True
+
+    def prebuildPages(self, interval=0):
+        """Build the remaining lazy pages one per event loop turn"""
+        if self._prebuild_timer is None:
+            self._prebuild_timer = QTimer(self)
+            self._prebuild_timer.timeout.connect(self._prebuildNextPage)
+        self._prebuild_timer.start(interval)
+
+    def _prebuildNextPage(self):
+        if not self.page_builders:
+            self._prebuild_timer.stop()
+            return
+        self.buildPage(next(iter(self.page_builders)))
+
+    def setCurrentIndex(self, index):
+        # During a slide the page is only made current once the slide has settled on it
+        if self.is_animating:
+            self._settle(index)
+            return
+        self.buildPage(self.widget(index))
+        super(SlidingStackedWidget, self).setCurrentIndex(index)
+
+    def setCurrentWidget(self, widget):
+        self.setCurrentIndex(self.indexOf(widget))
 
     @pyqtSlot()
     def slideInNext(self):
@@ -47,17 +139,19 @@ class SlidingStackedWidget(QStackedWidget):
         if target_index == -1:
             return
 
-        # Skip if trying to animate to the widget that is currently being animated to
-        # This prevents animation conflicts when the same target is requested multiple times
-        if target_index == self.next_index:
+        # Build lazy pages before they are laid out for the transition
+        self.buildPage(newwidget)
+
+        # Skip if trying to animate to the widget that is already shown or being animated to
+        if target_index == (self.next_index if self.is_animating else self.currentIndex()):
             return
 
         # Store the target and ensure it's visible
         self.target_index = target_index
 
-        # Handle ongoing animation
+        # Handle ongoing animation: go to the latest target now, skipping the one in flight
         if self.is_animating:
-            # Wait for current animation to finish
+            self._retarget(target_index)
             return
 
         # Start new transition
@@ -112,8 +206,32 @@ class SlidingStackedWidget(QStackedWidget):
                 # Hide only widgets not involved in any way
                 widget.hide()
 
-    def _startAnimation(self):
-        """Start transition animation with enhanced state management"""
+    def _retarget(self, target_index):
+        """Replace the running transition with one to target_index
+
+        The new slide starts where the page in view is on screen now, that page is
+        never made current so only the final target is entered.
+        """
+        elapsed = self.animation_group.currentTime()
+        duration = self.animation_group.totalDuration()
+        # Continue from the page that fills most of the view
+        shown = self.next_index if elapsed * 2 >= duration else self.current_index
+        if self.retarget_mode == "jump" or shown == target_index:
+            self._settle(target_index)
+            return
+        progress = QEasingCurve(self.animation_curve).valueForProgress(elapsed / duration) if duration else 1.0
+        start, end = self.slide_offsets[2:] if shown == self.next_index else self.slide_offsets[:2]
+        offset = start + (end - start) * progress
+
+        self.animation_group.stop()
+        self.animation_group = None
+        self._removeSnapshotOverlay()
+        self.target_index = target_index
+        self._prepareTransition(shown, target_index)
+        self._startAnimation(max(duration - elapsed, self.animation_speed // 3), offset)
+
+    def _startAnimation(self, duration=None, start=None):
+        """Start transition animation with enhanced state management, the current page starts at offset start"""
         if self.animation_group is not None:
             self._cleanupAnimation()
 
@@ -121,16 +239,6 @@ class SlidingStackedWidget(QStackedWidget):
         current_widget = self.widget(self.current_index)
         next_widget = self.widget(self.next_index)
 
-        # Ensure proper stacking order before animation
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if widget == next_widget:
-                widget.raise_()
-            elif widget == current_widget:
-                widget.raise_()
-            elif i == self.target_index:
-                widget.lower()
-
         # Create animation group
         self.animation_group = QParallelAnimationGroup(self)
         self.animation_group.finished.connect(self._onAnimationFinished)
@@ -140,7 +248,8 @@ class SlidingStackedWidget(QStackedWidget):
         self._cleanup_timer.setSingleShot(True)
         self._cleanup_timer.timeout.connect(self._forceFinishAnimation)
 
-        # Save widget states for animation validation
+        # Stacking and visibility were set once by _prepareTransition
+        self.frame_stats["transitions"] += 1
         self.active_widgets = {current_widget, next_widget}
         if self.target_index not in [self.current_index, self.next_index]:
             last_widget = self.widget(self.target_index)
@@ -174,55 +283,96 @@ class SlidingStackedWidget(QStackedWidget):
                 next_start = QPoint(0, -rect.height())
             next_end = QPoint(0, 0)
 
-        # 確保當前頁面在原點開始
-        current_widget.move(rect.topLeft())
+        # A retargeted slide keeps the pages side by side from where the current one is
+        current_start = start if start is not None else QPoint(0, 0)
+        current_end += current_start
+        next_start += current_start
+        self.slide_offsets = (current_start, current_end, next_start, next_end)
+
+        duration = duration or self.animation_speed
+        if self.transition_mode == "snapshot":
+            self._startSnapshotAnimation(current_widget, next_widget, rect, duration)
+            return
+
+        # 確保當前頁面在起點開始
+        current_widget.move(rect.topLeft() + current_start)
 
         # Create parallel group for synchronized movement
         parallel_group = QParallelAnimationGroup()
 
         # Create current page animation
         current_anim = QPropertyAnimation(current_widget, b"pos", self)
-        current_anim.setDuration(self.animation_speed)
+        current_anim.setDuration(duration)
         current_anim.setEasingCurve(self.animation_curve)
         current_anim.setStartValue(current_widget.pos())
         current_anim.setEndValue(rect.topLeft() + current_end)
 
         # Create next page animation
         next_anim = QPropertyAnimation(next_widget, b"pos", self)
-        next_anim.setDuration(self.animation_speed)
+        next_anim.setDuration(duration)
         next_anim.setEasingCurve(self.animation_curve)
-        next_anim.setStartValue(next_start)
+        next_anim.setStartValue(rect.topLeft() + next_start)
         next_anim.setEndValue(rect.topLeft() + next_end)
 
         # Add animations to group
         parallel_group.addAnimation(current_anim)
         parallel_group.addAnimation(next_anim)
 
-        # Add state validation
-        current_anim.valueChanged.connect(lambda: self._validateWidgetState(current_widget))
-        next_anim.valueChanged.connect(lambda: self._validateWidgetState(next_widget))
-
         self.animation_group.addAnimation(parallel_group)
         self.animation_group.start()
 
-    def _validateWidgetState(self, widget):
-        """Ensure proper widget state during animation"""
-        if not widget.isVisible() and widget in self.active_widgets:
-            widget.show()
+    def _startSnapshotAnimation(self, current_widget, next_widget, rect, duration):
+        """Slide pixmaps of both pages, rendered once, the real next page is shown at the end"""
+        current_widget.move(rect.topLeft())
+        next_widget.setGeometry(rect)
+        if next_widget.layout() is not None:
+            next_widget.layout().activate()
+        current_pixmap = current_widget.grab()
+        next_pixmap = next_widget.grab()
+
+        self.snapshot_overlay = SnapshotOverlay(self)
+        self.snapshot_overlay.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.snapshot_overlay.setGeometry(rect)
+        self.snapshot_overlay.show()
+        self.snapshot_overlay.raise_()
+        current_widget.hide()
+        next_widget.hide()
+
+        stats = self.frame_stats
+        current_start, current_end, next_start, next_end = self.slide_offsets
+        def step(progress):
+            start = time.perf_counter()
+            self.snapshot_overlay.setPieces([
+                (current_pixmap, QRect(current_start + (current_end - current_start) * progress, rect.size())),
+                (next_pixmap, QRect(next_start + (next_end - next_start) * progress, rect.size())),
+            ])
+            elapsed = (time.perf_counter() - start) * 1000
+            stats["frames"] += 1
+            stats["python_ms"] += elapsed
+            stats["max_frame_ms"] = max(stats["max_frame_ms"], elapsed)
+        animation = QVariantAnimation(self)
+        animation.setDuration(duration)
+        animation.setEasingCurve(self.animation_curve)
+        animation.setStartValue(0.0)
+        animation.setEndValue(1.0)
+        animation.valueChanged.connect(step)
+        step(0.0)
+
+        self.animation_group.addAnimation(animation)
+        self.animation_group.start()
 
-        # Maintain proper stacking order
-        if widget == self.widget(self.next_index):
-            widget.raise_()
-        elif widget == self.widget(self.current_index):
-            widget.raise_()
-        elif widget == self.widget(self.target_index):
-            widget.lower()  # Keep last target below current animation
+    def _removeSnapshotOverlay(self):
+        if self.snapshot_overlay is not None:
+            self.snapshot_overlay.hide()
+            self.snapshot_overlay.deleteLater()
+            self.snapshot_overlay = None
 
     def _cleanupAnimation(self):
         """Clean up current animation"""
         if self.animation_group is not None:
             self.animation_group.stop()
             self.animation_group = None
+        self._removeSnapshotOverlay()
 
         # Reset positions
         rect = self.frameRect()
@@ -240,80 +390,66 @@ class SlidingStackedWidget(QStackedWidget):
         if hasattr(self, '_cleanup_timer') and self._cleanup_timer.isActive():
             self._cleanup_timer.stop()
 
-        # Stop current animation
-        self.animation_group.stop()
-        self.animation_group = None
+        # Retargeting restarts the transition, so the page slid in is the final target
+        self._settle(self.next_index)
 
-        # Get frame geometry
-        rect = self.frameRect()
+    def _forceFinishAnimation(self):
+        """Force finish current animation and jump to final target"""
+        if self.is_animating and self.animation_group:
+            self._settle(self.target_index)
 
-        # 獲取當前索引和目標
-        current_target = self.next_index
-        final_target = self.target_index
+    def _settle(self, index):
+        """Stop any transition and show page index in place"""
+        if self.animation_group is not None:
+            self.animation_group.stop()
+            self.animation_group = None
+        self._removeSnapshotOverlay()
 
-        # Get current and target indices
-        self.current_index = current_target
-        self.setCurrentIndex(current_target)
+        self.current_index = index
+        self.next_index = index
+        self.is_animating = False
+        self.setCurrentIndex(index)
 
-        # Reset widget positions
-        for widget in self.active_widgets:
+        # Update final widget states
+        rect = self.frameRect()
+        for i in range(self.count()):
+            widget = self.widget(i)
+            if i == index:
+                widget.show()
+                widget.raise_()
+            else:
+                widget.hide()
             widget.move(rect.topLeft())
 
-        # Check if further transitions are needed
-        if final_target is not None and final_target != current_target:
-            # Reset animation state
-            self.is_animating = False
-            self.active_widgets.clear()
-
-            # Keep related widgets visible and in proper order
-            for i in range(self.count()):
-                widget = self.widget(i)
-                if i == current_target:
-                    widget.show()
-                    widget.raise_()
-                else:
-                    widget.hide()
-                widget.move(rect.topLeft())
-
-            # Trigger next transition
-            QTimer.singleShot(0, lambda: self.slideInWgt(self.widget(final_target)))
-        else:
-            # Final target reached
-            self.is_animating = False
-            self.animation_group = None
-            self.target_index = None
-            self.active_widgets.clear()
-
-            # Update final widget states
-            for i in range(self.count()):
-                widget = self.widget(i)
-                if i == current_target:
-                    widget.show()
-                    widget.raise_()
-                else:
-                    widget.hide()
-                widget.move(rect.topLeft())
-
-    def _forceFinishAnimation(self):
-        """Force finish current animation and jump to final target"""
-        if self.is_animating and self.animation_group:
-            self.animation_group.stop()
+        # Clear state
+        self.target_index = None
+        self.active_widgets.clear()
 
-            # Show final target immediately
-            target_widget = self.widget(self.target_index)
-            target_widget.move(self.frameRect().topLeft())
-            target_widget.show()
-            target_widget.raise_()
-            self.setCurrentIndex(self.target_index)
+    def _pageChanged(self, index):
+        """Tell the page left and the page shown, then the shown page once the event loop is idle"""
+        page = self.widget(index)
+        if page is self.shown_page:
+            return
+        left, self.shown_page = self.shown_page, page
+        if left is not None and self.indexOf(left) != -1:
+            self._notifyPage(left, "on_leave")
+            self.pageLeft.emit(self.indexOf(left))
+        if page is None:
+            return
+        self._notifyPage(page, "on_enter")
+        self.pageEntered.emit(index)
+        QTimer.singleShot(0, lambda: self._pageIdle(page))
 
-            # Hide all other widgets
-            for i in range(self.count()):
-                if i != self.target_index:
-                    self.widget(i).hide()
+    def _pageIdle(self, page):
+        # Skipped when another page was shown or a slide started meanwhile
+        if page is self.shown_page and not self.is_animating:
+            self._notifyPage(page, "on_idle")
+            self.pageIdle.emit(self.indexOf(page))
 
-            # Clear state
-            self.is_animating = False
-            self.animation_group = None
+    def _notifyPage(self, page, hook):
+        callback = getattr(page, hook, None)
+        if callable(callback):
+            callback()
 
     def setDirection(self, direction):
         self.animation_direction = direction
@@ -325,4 +461,16 @@ class SlidingStackedWidget(QStackedWidget):
         self.animation_curve = animationtype
 
     def setWrap(self, wrap):
-        self.enable_wrap = wrap
\ No newline at end of file
+        self.enable_wrap = wrap
+
+    def setTransitionMode(self, mode):
+        self.transition_mode = mode
+
+    def setRetargetMode(self, mode):
+        self.retarget_mode = mode
+
+    def frameStats(self):
+        """Transition counters, python_ms is the Python time spent inside animation frames"""
+        stats = dict(self.frame_stats)
+        stats["avg_frame_ms"] = stats["python_ms"] / stats["frames"] if stats["frames"] else 0.0
+        return stats
\ No newline at end of file
@@ -0,0 +1,168 @@
+from PyQt5.QtCore import Qt, QObject, QRect, QElapsedTimer, QVariantAnimation, QEasingCurve, pyqtSignal
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QWidget
+
+class SnapshotOverlay(QWidget):
+    """Child widget that covers its parent and paints cached pixmaps instead of live widgets"""
+    def __init__(self, parent, background=None):
+        super(SnapshotOverlay, self).__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, background is not None)
+        self.background = background
+        # (pixmap, target QRect), each pixmap is drawn from its top left and clipped to its target
+        self.pieces = []
+        self.setGeometry(parent.rect())
+
+    def setPieces(self, pieces):
+        self.pieces = pieces
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.background is not None:
+            painter.drawPixmap(0, 0, self.background)
+        for pixmap, target in self.pieces:
+            painter.setClipRect(target)
+            painter.drawPixmap(target.topLeft(), pixmap)
+        painter.end()
+
+class FrameBudget(QObject):
+    """Jump an animation to its end once several frames in a row take longer than budget_ms"""
+    SLOW_FRAMES = 3
+
+    def __init__(self, animation, tick, budget_ms, parent=None):
+        super(FrameBudget, self).__init__(parent or animation)
+        self.animation = animation
+        self.budget_ms = budget_ms
+        self.slow_frames = 0
+        self.skipped = False
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        tick.connect(self._tick)
+
+    def reset(self):
+        """Call when the animation starts again"""
+        self.slow_frames = 0
+        self.skipped = False
+        self.clock.restart()
+
+    def _tick(self, *args):
+        if self.clock.restart() > self.budget_ms:
+            self.slow_frames += 1
+        else:
+            self.slow_frames = 0
+        if self.slow_frames >= self.SLOW_FRAMES and not self.skipped:
+            self.skipped = True
+            self.animation.setCurrentTime(self.animation.totalDuration())
+
+class LayoutMorph(QObject):
+    """Animate a layout change on cached pixmaps instead of relayouting every frame
+
+    The tracked widgets are grabbed once, the final layout is committed in a
+    single pass under an overlay, and only the overlay repaints while the
+    pixmaps slide from their start to their final geometry. One instance is
+    reused for every change, start() during a slide retargets it.
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, container, widgets, duration=500, easing=QEasingCurve.InOutQuart, parent=None,
+                 frame_budget_ms=0):
+        super(LayoutMorph, self).__init__(parent)
+        self.container = container
+        self.widgets = widgets
+        self.frame_budget_ms = frame_budget_ms
+        self.overlay = None
+        self.animation = QVariantAnimation(self)
+        self.animation.setDuration(duration)
+        self.animation.setEasingCurve(easing)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.valueChanged.connect(self._step)
+        self.animation.finished.connect(self._finish)
+        self.frame_budget = None
+        if frame_budget_ms:
+            self.frame_budget = FrameBudget(self.animation, self.animation.valueChanged, frame_budget_ms, self)
+        # (widget, pixmap, start QRect, end QRect)
+        self.tracks = []
+
+    def start(self, commit):
+        """commit() applies the final layout values (e.g. minimum widths)"""
+        if self.isRunning():
+            self._retarget(commit)
+            return
+        clock = QElapsedTimer()
+        clock.start()
+        before = {widget: self.geometryOf(widget) for widget in self.widgets}
+        grabs = {widget: widget.grab() for widget in self.widgets if widget.isVisible() and widget.width()}
+        self.overlay = SnapshotOverlay(self.container, self.container.grab())
+        self.overlay.show()
+        self.overlay.raise_()
+
+        # One layout pass for the whole animation
+        commit()
+        self.container.layout().activate()
+
+        self.tracks = []
+        for widget in self.widgets:
+            start, end = before[widget], self.geometryOf(widget)
+            # The wider state has the most to show while the width changes
+            if end.width() > start.width() or widget not in grabs:
+                pixmap = widget.grab() if widget.width() else None
+            else:
+                pixmap = grabs[widget]
+            if pixmap is not None:
+                self.tracks.append((widget, pixmap, start, end))
+        # Skip the slide when preparing it already blew the frame budget
+        if self.frame_budget_ms and clock.elapsed() > self.frame_budget_ms:
+            self._finish()
+            return
+        self._run()
+
+    def _retarget(self, commit):
+        # Slide on from where the pixmaps are shown now to the new final layout
+        self.animation.stop()
+        shown = {track[0]: rect for track, (pixmap, rect) in zip(self.tracks, self.overlay.pieces)}
+        before = {widget: self.geometryOf(widget) for widget in self.widgets}
+        pixmaps = {track[0]: track[1] for track in self.tracks}
+        commit()
+        self.container.layout().activate()
+
+        self.tracks = []
+        for widget in self.widgets:
+            end = self.geometryOf(widget)
+            pixmap = pixmaps.get(widget)
+            if widget.width() and (pixmap is None or end.width() > pixmap.width()):
+                pixmap = widget.grab()
+            if pixmap is not None:
+                self.tracks.append((widget, pixmap, shown.get(widget, before[widget]), end))
+        self._run()
+
+    def _run(self):
+        if self.frame_budget is not None:
+            self.frame_budget.reset()
+        self._step(0.0)
+        self.animation.start()
+
+    def isRunning(self):
+        return self.animation.state() == QVariantAnimation.Running
+
+    def geometryOf(self, widget):
+        return QRect(widget.mapTo(self.container, widget.rect().topLeft()), widget.size())
+
+    def _step(self, progress):
+        if self.overlay is None:
+            return
+        pieces = []
+        for widget, pixmap, start, end in self.tracks:
+            pieces.append((pixmap, QRect(
+                round(start.x() + (end.x() - start.x()) * progress),
+                round(start.y() + (end.y() - start.y()) * progress),
+                round(start.width() + (end.width() - start.width()) * progress),
+                round(start.height() + (end.height() - start.height()) * progress))))
+        self.overlay.setPieces(pieces)
+
+    def _finish(self):
+        self.overlay.hide()
+        self.overlay.deleteLater()
+        self.overlay = None
+        self.tracks = []
+        self.finished.emit()